@@ -1,5 +1,5 @@
 from .connection import Connection, SignalRConnectionState
-from . import models, transports, protocols, exceptions
+from . import models, transports, protocols, codecs, exceptions, log, runtime, recording, fanout, conflation
 
 __all__ = [
     "Connection",
@@ -7,5 +7,11 @@ __all__ = [
     "models",
     "transports",
     "protocols",
-    "exceptions"
+    "codecs",
+    "exceptions",
+    "log",
+    "runtime",
+    "recording",
+    "fanout",
+    "conflation"
 ]
@@ -0,0 +1,10 @@
+from .base import BaseArgumentCodec
+from .typed import TypedArgumentCodec, compile_decoder, compile_encoder, camel_case
+
+__all__ = [
+    "BaseArgumentCodec",
+    "TypedArgumentCodec",
+    "compile_decoder",
+    "compile_encoder",
+    "camel_case"
+]
@@ -0,0 +1,21 @@
+import typing
+
+
+class BaseArgumentCodec:
+    """
+    Base argument codec class
+    - Converts the arguments of a target between their protocol representation (lists, dicts, strings, numbers and
+      bytes as produced by any SignalR protocol) and the python objects handed to handlers and passed to invoke
+    """
+
+    def decode(self, arguments: typing.List[typing.Any]) -> typing.List[typing.Any]:
+        """
+        This method should convert downstream arguments into python objects
+        """
+        raise NotImplementedError("Implementation Required")
+
+    def encode(self, arguments: typing.List[typing.Any]) -> typing.List[typing.Any]:
+        """
+        This method should convert python objects into upstream arguments
+        """
+        raise NotImplementedError("Implementation Required")
@@ -0,0 +1,320 @@
+import enum
+import types
+import base64
+import typing
+import datetime
+import dataclasses
+from async_signalr_client.exceptions import SignalRInvalidMessageError
+from async_signalr_client.codecs.base import BaseArgumentCodec
+
+Converter = typing.Callable[[typing.Any], typing.Any]
+FieldNamer = typing.Callable[[str], str]
+
+_MISSING = object()
+_IDENTITY_TYPES = (typing.Any, object, int, str, bool, type(None))
+
+
+def camel_case(name: str) -> str:
+    """
+    Converts a python attribute name into the camelCase name used by default by DotNet serializers
+    """
+    head, *tail = name.split("_")
+    return head + "".join(x.capitalize() for x in tail)
+
+
+def _identity(value):
+    return value
+
+
+def _decode_bytes(value):
+    # JSON protocol transfers binary data as base64 strings, binary protocols as raw bytes
+    if isinstance(value, str):
+        return base64.b64decode(value)
+    return bytes(value)
+
+
+def _decode_datetime(value):
+    if isinstance(value, datetime.datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.datetime.fromisoformat(value)
+
+
+def _is_record(tp) -> bool:
+    """
+    Records are dataclasses, NamedTuples or classes (slotted or not) declaring their attributes with type hints
+    """
+    if not isinstance(tp, type) or issubclass(tp, (enum.Enum, datetime.datetime, float, bytes)):
+        return False
+    if dataclasses.is_dataclass(tp) or _is_named_tuple(tp):
+        return True
+    return tp not in _IDENTITY_TYPES and bool(typing.get_type_hints(tp))
+
+
+def _is_named_tuple(tp) -> bool:
+    return issubclass(tp, tuple) and hasattr(tp, "_fields")
+
+
+def _record_fields(tp) -> typing.List[typing.Tuple[str, typing.Any, typing.Any]]:
+    """
+    Returns (attribute, type, default) for every field of a record
+    Note: default is either _MISSING, a value or a zero argument factory wrapped in a list
+    """
+    hints = typing.get_type_hints(tp)
+    result = []
+    if dataclasses.is_dataclass(tp):
+        for field in dataclasses.fields(tp):
+            if not field.init:
+                continue
+            default = _MISSING
+            if field.default is not dataclasses.MISSING:
+                default = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                default = [field.default_factory]
+            result.append((field.name, hints[field.name], default))
+    elif _is_named_tuple(tp):
+        defaults = getattr(tp, "_field_defaults", {})
+        for name in tp._fields:
+            result.append((name, hints.get(name, typing.Any), defaults.get(name, _MISSING)))
+    else:
+        for name, hint in hints.items():
+            if typing.get_origin(hint) is typing.ClassVar:
+                continue
+            default = getattr(tp, name, _MISSING)
+            if isinstance(default, types.MemberDescriptorType):
+                # Slot descriptors are not default values
+                default = _MISSING
+            result.append((name, hint, default))
+    return result
+
+
+def _optional_member(tp):
+    members = [x for x in typing.get_args(tp) if x is not type(None)]
+    if len(members) != 1:
+        raise TypeError(f"Only Optional unions are supported: {tp}")
+    return members[0]
+
+
+def _is_homogeneous(origin, args) -> bool:
+    return origin in (list, set, frozenset) or (origin is tuple and len(args) == 2 and args[1] is Ellipsis)
+
+
+class _Compiler:
+    """
+    Generates python source converting values of a given type and compiles it once
+    - Containers become comprehensions and dataclasses/NamedTuples are constructed inline
+    - Slotted/annotated classes and self referencing records are converted by dedicated generated functions
+    """
+
+    def __init__(self, field_name: FieldNamer):
+        self.field_name = field_name
+        self.namespace = {}
+        self.functions = {}
+        self._inlining = set()
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def ref(self, obj: typing.Any) -> str:
+        """
+        Makes an object available to the generated source and returns its name
+        """
+        name = self._name("_r")
+        self.namespace[name] = obj
+        return name
+
+    def define(self, name: str, argument: str, lines: typing.List[str]) -> Converter:
+        source = f"def {name}({argument}):\n" + "".join(f"    {line}\n" for line in lines)
+        exec(compile(source, f"<codec {name}>", "exec"), self.namespace)
+        return self.namespace[name]
+
+    def converter(self, direction: str, tp) -> Converter:
+        expression = self.expression(direction, tp, "value")
+        if expression == "value":
+            return _identity
+        return self.define(self._name(f"_{direction}"), "value", [f"return {expression}"])
+
+    def expression(self, direction: str, tp, var: str) -> str:
+        if direction == "decode":
+            return self.decode(tp, var)
+        return self.encode(tp, var)
+
+    def _record_function(self, direction: str, tp) -> str:
+        key = (direction, tp)
+        if key not in self.functions:
+            # Registered before compiling the body so that self references resolve to the function
+            name = self.functions[key] = self._name(f"_{direction}_{tp.__name__}_")
+            if direction == "decode":
+                lines = self._decode_record_lines(tp, "value")
+            else:
+                lines = [f"return {self._encode_record(tp, 'value')}"]
+            self.define(name, "value", lines)
+        return self.functions[key]
+
+    def _inline_record(self, direction: str, tp, var: str) -> bool:
+        if not var.isidentifier() or (direction, tp) in self.functions or (direction, tp) in self._inlining:
+            return False
+        return direction == "encode" or dataclasses.is_dataclass(tp) or _is_named_tuple(tp)
+
+    def _inline(self, direction: str, tp, var: str) -> str:
+        # Self references found while inlining a record are converted by a dedicated function instead
+        self._inlining.add((direction, tp))
+        try:
+            if direction == "decode":
+                return self._decode_record(tp, var)
+            return self._encode_record(tp, var)
+        finally:
+            self._inlining.discard((direction, tp))
+
+    def _field_expression(self, hint, key: str, default: typing.Any, var: str) -> str:
+        expression = self.decode(hint, f"{var}[{key!r}]")
+        if default is _MISSING:
+            return expression
+        fallback = f"{self.ref(default[0])}()" if isinstance(default, list) else self.ref(default)
+        return f"({expression} if {key!r} in {var} else {fallback})"
+
+    def _decode_record(self, tp, var: str) -> str:
+        keyword_only = {x.name for x in dataclasses.fields(tp) if getattr(x, "kw_only", False) is True} \
+            if dataclasses.is_dataclass(tp) else set()
+        positional, keywords = [], []
+        for name, hint, default in _record_fields(tp):
+            expression = self._field_expression(hint, self.field_name(name), default, var)
+            # Positional arguments are noticeably cheaper than keywords when constructing
+            if name in keyword_only:
+                keywords.append(f"{name}={expression}")
+            else:
+                positional.append(expression)
+        return f"{self.ref(tp)}({', '.join(positional + keywords)})"
+
+    def _decode_record_lines(self, tp, var: str) -> typing.List[str]:
+        if dataclasses.is_dataclass(tp) or _is_named_tuple(tp):
+            return [f"return {self._decode_record(tp, var)}"]
+        # Annotated classes are populated without calling __init__ so that slotted classes work as well
+        lines = [f"obj = {self.ref(tp)}.__new__({self.ref(tp)})"]
+        for name, hint, default in _record_fields(tp):
+            lines.append(f"obj.{name} = {self._field_expression(hint, self.field_name(name), default, var)}")
+        lines.append("return obj")
+        return lines
+
+    def _encode_record(self, tp, var: str) -> str:
+        items = ", ".join(f"{self.field_name(name)!r}: {self.encode(hint, f'{var}.{name}')}"
+                          for name, hint, _ in _record_fields(tp))
+        return f"{{{items}}}"
+
+    def decode(self, tp, var: str) -> str:
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if tp in _IDENTITY_TYPES:
+            return var
+        if tp is float:
+            return f"float({var})"
+        if tp is bytes:
+            return f"{self.ref(_decode_bytes)}({var})"
+        if tp is datetime.datetime:
+            return f"{self.ref(_decode_datetime)}({var})"
+        if isinstance(tp, type) and issubclass(tp, enum.Enum):
+            return f"{self.ref(tp)}({var})"
+        if origin is typing.Union:
+            inner = self.decode(_optional_member(tp), var)
+            return var if inner == var else f"(None if {var} is None else {inner})"
+        if _is_homogeneous(origin, args):
+            item = self._name("_v")
+            inner = self.decode(args[0] if args else typing.Any, item)
+            if origin is list:
+                return var if inner == item else f"[{inner} for {item} in {var}]"
+            if origin is set:
+                return f"{{{inner} for {item} in {var}}}"
+            return f"{self.ref(origin)}([{inner} for {item} in {var}])"
+        if origin is tuple:
+            items = "".join(f"{self.decode(x, f'{var}[{i}]')}, " for i, x in enumerate(args))
+            return f"({items})"
+        if origin is dict:
+            key, item = self._name("_k"), self._name("_v")
+            inner = self.decode(args[1] if args else typing.Any, item)
+            return var if inner == item else f"{{{key}: {inner} for {key}, {item} in {var}.items()}}"
+        if _is_record(tp):
+            if self._inline_record("decode", tp, var):
+                return self._inline("decode", tp, var)
+            return f"{self._record_function('decode', tp)}({var})"
+        raise TypeError(f"Unsupported argument type: {tp}")
+
+    def encode(self, tp, var: str) -> str:
+        origin, args = typing.get_origin(tp), typing.get_args(tp)
+        if tp in _IDENTITY_TYPES or tp in (float, bytes):
+            return var
+        if tp is datetime.datetime:
+            return f"{var}.isoformat()"
+        if isinstance(tp, type) and issubclass(tp, enum.Enum):
+            return f"{var}.value"
+        if origin is typing.Union:
+            inner = self.encode(_optional_member(tp), var)
+            return var if inner == var else f"(None if {var} is None else {inner})"
+        if _is_homogeneous(origin, args):
+            item = self._name("_v")
+            inner = self.encode(args[0] if args else typing.Any, item)
+            return var if origin is list and inner == item else f"[{inner} for {item} in {var}]"
+        if origin is tuple:
+            return f"[{', '.join(self.encode(x, f'{var}[{i}]') for i, x in enumerate(args))}]"
+        if origin is dict:
+            key, item = self._name("_k"), self._name("_v")
+            inner = self.encode(args[1] if args else typing.Any, item)
+            return var if inner == item else f"{{{key}: {inner} for {key}, {item} in {var}.items()}}"
+        if _is_record(tp):
+            if self._inline_record("encode", tp, var):
+                return self._inline("encode", tp, var)
+            return f"{self._record_function('encode', tp)}({var})"
+        raise TypeError(f"Unsupported argument type: {tp}")
+
+
+def compile_decoder(tp, field_name: typing.Optional[FieldNamer] = None) -> Converter:
+    """
+    Compiles a function converting a decoded protocol value into an instance of the given type
+    """
+    return _Compiler(field_name or _identity).converter("decode", tp)
+
+
+def compile_encoder(tp, field_name: typing.Optional[FieldNamer] = None) -> Converter:
+    """
+    Compiles a function converting an instance of the given type into a value every protocol can encode
+    """
+    return _Compiler(field_name or _identity).converter("encode", tp)
+
+
+class TypedArgumentCodec(BaseArgumentCodec):
+    """
+    Converts the arguments of a target from/into the given types
+    - Types may be primitives, datetime, Enum, bytes, List/Tuple/Set/Dict/Optional generics and records
+      (dataclasses, NamedTuples and slotted or regular classes declaring their fields with type hints)
+    - Decoders and encoders are compiled once when the codec is created
+    - field_name: Maps python attribute names to payload keys (e.g. camel_case)
+    Note: Arguments beyond the given types are passed through unchanged
+    """
+
+    def __init__(self, *types: typing.Any, field_name: typing.Optional[FieldNamer] = None):
+        self.types = types
+        compiler = _Compiler(field_name or _identity)
+        self._decode = self._compile_arguments(compiler, "decode", types)
+        self._encode = self._compile_arguments(compiler, "encode", types)
+
+    @staticmethod
+    def _compile_arguments(compiler: _Compiler, direction: str, types: tuple) -> Converter:
+        lines = [f"v{i} = arguments[{i}]" for i in range(len(types))]
+        lines.append(f"result = [{', '.join(compiler.expression(direction, x, f'v{i}') for i, x in enumerate(types))}]")
+        lines.append(f"if len(arguments) > {len(types)}:")
+        lines.append(f"    result.extend(arguments[{len(types)}:])")
+        lines.append("return result")
+        return compiler.define(f"{direction}_arguments", "arguments", lines)
+
+    def decode(self, arguments: typing.List[typing.Any]) -> typing.List[typing.Any]:
+        try:
+            return self._decode(arguments)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            raise SignalRInvalidMessageError(f"Unable to decode arguments as {self.types}: {e!r}")
+
+    def encode(self, arguments: typing.List[typing.Any]) -> typing.List[typing.Any]:
+        try:
+            return self._encode(arguments)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            raise SignalRInvalidMessageError(f"Unable to encode arguments as {self.types}: {e!r}")
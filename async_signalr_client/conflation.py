@@ -0,0 +1,60 @@
+import typing
+import asyncio
+
+from async_signalr_client.models import messages
+
+ConflationKey = typing.Union[None, int, typing.Callable[[list], typing.Hashable]]
+
+
+class Conflator:
+    """
+    Latest-value-wins dispatch for a target
+    - While the handlers of a key are running, newer messages for that key replace the pending one
+    - key: None conflates the whole target, an int conflates per value of the argument at that index,
+      a callable receives the arguments as received (before the target codec) and returns the key
+    - merged: Number of messages replaced before reaching the handlers
+    - delivered: Number of messages the handlers were called with
+    Note: Without a key, replaced messages are never decoded (see JsonProtocol lazy_arguments)
+    """
+
+    def __init__(self, key: ConflationKey = None):
+        self.key = key
+        self.merged = 0
+        self.delivered = 0
+        self._pending: typing.Dict[typing.Hashable, messages.InvocationMessage] = dict()
+        self._running: typing.Set[typing.Hashable] = set()
+
+    def key_of(self, message: messages.InvocationMessage) -> typing.Hashable:
+        if self.key is None:
+            return None
+        if callable(self.key):
+            return self.key(message.arguments)
+        return message.arguments[self.key]
+
+    def submit(self,
+               message: messages.InvocationMessage,
+               dispatch: typing.Callable[[messages.InvocationMessage], typing.Awaitable[None]]):
+        """
+        Schedules the message, replacing the message of the same key that is still waiting
+        """
+        key = self.key_of(message)
+        if key in self._pending:
+            self.merged += 1
+        self._pending[key] = message
+        if key not in self._running:
+            self._running.add(key)
+            asyncio.get_running_loop().create_task(self._drain(key, dispatch))
+
+    async def _drain(self, key: typing.Hashable,
+                     dispatch: typing.Callable[[messages.InvocationMessage], typing.Awaitable[None]]):
+        try:
+            while key in self._pending:
+                message = self._pending.pop(key)
+                self.delivered += 1
+                await dispatch(message)
+        finally:
+            self._running.discard(key)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
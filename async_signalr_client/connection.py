@@ -7,7 +7,7 @@ import websockets
 from enum import Enum
 from io import StringIO
 
-from async_signalr_client import protocols, exceptions
+from async_signalr_client import protocols, exceptions, codecs, log, recording, conflation, lanes
 from async_signalr_client.models import messages, futures
 from async_signalr_client.transports import BaseTransport, WebSocketTransport
 
@@ -28,28 +28,46 @@ class Connection:
                  protocol: protocols.BaseSignalRProtocol = protocols.JsonProtocol(),
                  establishing_connection_timeout_s: int = 20,
                  ping_interval_s: int = 60,
-                 log_level: int = logging.DEBUG):
+                 log_level: int = logging.DEBUG,
+                 wire_log_sample_every: int = 1,
+                 wire_log_max_length: int = 512,
+                 transport_options: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                 recorder: typing.Optional[recording.WireRecorder] = None,
+                 lane_weights: typing.Optional[typing.Dict[lanes.Lane, int]] = None):
         self.url = url
-        self.transport = transport(url)
+        self.recorder = recorder
+        self.transport = transport(url, **(transport_options or {}))
+        self.transport.wire_logger.configure(wire_log_sample_every, wire_log_max_length)
         self.protocol = protocol
         self.connection_timeout = establishing_connection_timeout_s
         self.ping_interval_s = ping_interval_s
 
-        self.event_queue = asyncio.Queue()
         self._state = SignalRConnectionState.OFFLINE  # Controls the state of the async_signalr_client
-        self.establishing_connection_lock = asyncio.Lock()
-        self.connection_established = asyncio.Future()  # Future set when connection and negotiation finishes
         self._completion_futures: typing.Dict[str, futures.InvokeCompletionFuture] = dict()
-        self.stop_event = asyncio.Event()
+        # Asyncio primitives are created on first use, within the running loop (see properties below)
+        self._event_queue: typing.Optional[asyncio.Queue] = None
+        self._establishing_connection_lock: typing.Optional[asyncio.Lock] = None
+        self._connection_established: typing.Optional[asyncio.Future] = None
+        self._stop_event: typing.Optional[asyncio.Event] = None
+
+        # Framed packets waiting for dispatch, completions/pings/close ahead of invocations
+        self.lanes = lanes.PriorityLanes(lane_weights)
 
         # Client Tasks
         self.process_task = None
+        self.dispatch_task = None
         self.keep_alive_task = None
 
         # Monitoring Variables
         self._last_ping_sent = None
         self._last_ping_received = None
 
+        # Argument codecs per target
+        self._codecs: typing.Dict[str, codecs.BaseArgumentCodec] = dict()
+
+        # Latest-value-wins targets
+        self._conflators: typing.Dict[str, conflation.Conflator] = dict()
+
         # Register handlers
         self._handlers = dict()
         for x in dir(self):
@@ -58,10 +76,8 @@ class Connection:
                 self._handlers[event] = [getattr(self, x)]
 
         # Setup Logger
-        self.logger = logging.getLogger("AsyncSignalRClient")
-        t = logging.StreamHandler()
-        t.setLevel(log_level)
-        self.logger.addHandler(t)
+        self.logger = logging.getLogger(log.LOGGER_NAME)
+        log.attach_handler(log_level)
 
     @property
     def state(self) -> SignalRConnectionState:
@@ -70,24 +86,75 @@ class Connection:
         """
         return self._state
 
+    @property
+    def event_queue(self) -> asyncio.Queue:
+        """
+        Queue where the transport adds the payloads received
+        Note: With a recorder every payload is written to the recording as it is added
+        """
+        if self._event_queue is None:
+            self._event_queue = asyncio.Queue() if self.recorder is None else recording.RecordingQueue(self.recorder)
+        return self._event_queue
+
+    @property
+    def establishing_connection_lock(self) -> asyncio.Lock:
+        if self._establishing_connection_lock is None:
+            self._establishing_connection_lock = asyncio.Lock()
+        return self._establishing_connection_lock
+
+    @property
+    def connection_established(self) -> asyncio.Future:
+        """
+        Future set when connection and negotiation finishes
+        """
+        if self._connection_established is None:
+            self._connection_established = asyncio.get_running_loop().create_future()
+        return self._connection_established
+
+    @property
+    def stop_event(self) -> asyncio.Event:
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
+
     async def _call_handlers(self, message: messages.InvocationMessage):
         """
         Dispatches a task for each event handler registered to the async_signalr_client
         """
         handlers = self._handlers.get(message.target)
         if not handlers:
-            self.logger.warning(f"Unable to find handler for event: {message.target}")
+            self.logger.warning("Unable to find handler for event: %s", message.target)
+        elif message.target in self._conflators:
+            self._conflators[message.target].submit(message, self._dispatch_conflated)
         else:
-            loop = asyncio.get_event_loop()
+            arguments = message.arguments
+            codec = self._codecs.get(message.target)
+            if codec is not None:
+                arguments = codec.decode(arguments)
+            loop = asyncio.get_running_loop()
             for handler in handlers:
-                loop.create_task(handler(*message.arguments))
+                loop.create_task(handler(*arguments))
+
+    async def _dispatch_conflated(self, message: messages.InvocationMessage):
+        """
+        Runs the handlers of a conflated target and waits for them, so newer messages can be merged meanwhile
+        """
+        arguments = message.arguments
+        codec = self._codecs.get(message.target)
+        if codec is not None:
+            arguments = codec.decode(arguments)
+        handlers = self._handlers.get(message.target, [])
+        results = await asyncio.gather(*(handler(*arguments) for handler in handlers), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error("Handler for %s failed", message.target, exc_info=result)
 
     def _register_completion_futures(self, completion_future: futures.InvokeCompletionFuture):
         """
         Register the completion future for capturing the downstream result in the near future
         """
         if completion_future.invocation_id in self._completion_futures:
-            self.logger.warning(f"InvocationId:{completion_future.invocation_id} already registered...")
+            self.logger.warning("InvocationId:%s already registered...", completion_future.invocation_id)
         else:
             self._completion_futures[completion_future.invocation_id] = completion_future
         return self._completion_futures.get(completion_future.invocation_id)
@@ -104,7 +171,8 @@ class Connection:
         # Locate completion future pointer
         completion_future = self._completion_futures.get(completion_message.invocation_id)
         if not completion_future:
-            self.logger.warning(f"Completion Future for InvocationId:{completion_message.invocation_id} not found...")
+            self.logger.warning("Completion Future for InvocationId:%s not found...",
+                                completion_message.invocation_id)
         else:
             # Set completion result
             # It is expected that a reference to this object is kept by the user when invoking
@@ -114,7 +182,7 @@ class Connection:
         """
         Keeps connection alive by sending ping at a pre-set interval and monitoring incoming messages/pings
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         self._last_ping_sent = time.time()  # Initialize last ping reference to avoid sending ping on start
         while True:
             await asyncio.sleep(1)
@@ -142,7 +210,7 @@ class Connection:
         """
         # Initialize connection
         await self.connect()
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         # Starts processing payloads
         self.process_task = loop.create_task(self.process())
         # Monitors and keeps connection alive
@@ -164,34 +232,70 @@ class Connection:
             self.process_task.cancel()
         await self.on_stop()
 
+    def _classify(self, packet: typing.Union[str, bytes]):
+        """
+        Places a framed packet in its dispatch lane
+        """
+        if self.state is SignalRConnectionState.CONNECTING:
+            self.lanes.put(lanes.Lane.CONTROL, packet)
+        else:
+            self.lanes.put(self.lanes.lane_of(self.protocol.message_type(packet)), packet)
+
     async def process(self):
         """
-        Listens for incoming payloads dispatches a new task for each full message received
+        Listens for incoming payloads, frames and classifies every message received into the dispatch lanes
+        Note: Payloads already queued are framed eagerly, so control messages overtake queued invocations
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        self.dispatch_task = loop.create_task(self.dispatch())
         buffer = StringIO()
-        while True:
-            try:
-                if self.stop_event.is_set():
-                    return
-                # Cycle and wait for data
-                data = await self.event_queue.get()
-                if isinstance(data, bytes):
-                    loop.create_task(self._execute(data))
-                else:
-                    for _char in data:
-                        if _char == self.protocol.separator:
-                            loop.create_task(self._execute(buffer.getvalue()))
-                            buffer = StringIO()
+        try:
+            while True:
+                try:
+                    if self.stop_event.is_set():
+                        return
+                    # Cycle and wait for data
+                    data = await self.event_queue.get()
+                    while True:
+                        if isinstance(data, bytes):
+                            self._classify(data)
                         else:
-                            buffer.write(_char)
-            except asyncio.TimeoutError:
-                pass
-            except websockets.ConnectionClosed as e:
-                if self.state is SignalRConnectionState.ONLINE:
-                    self._state = SignalRConnectionState.DISCONNECTED
-                else:
-                    raise exceptions.SignalRConnectionError(e.reason)
+                            for _char in data:
+                                if _char == self.protocol.separator:
+                                    self._classify(buffer.getvalue())
+                                    buffer = StringIO()
+                                else:
+                                    buffer.write(_char)
+                        if self.event_queue.empty():
+                            break
+                        data = self.event_queue.get_nowait()
+                    self.lanes.ready.set()
+                except asyncio.TimeoutError:
+                    pass
+                except websockets.ConnectionClosed as e:
+                    if self.state is SignalRConnectionState.ONLINE:
+                        self._state = SignalRConnectionState.DISCONNECTED
+                    else:
+                        raise exceptions.SignalRConnectionError(e.reason)
+        finally:
+            self.dispatch_task.cancel()
+
+    async def dispatch(self):
+        """
+        Executes the framed packets one weighted round at a time (see lanes.PriorityLanes)
+        """
+        ready = self.lanes.ready
+        while True:
+            if not self.lanes:
+                ready.clear()
+                await ready.wait()
+            for packet in self.lanes.next_round():
+                try:
+                    await self._execute(packet)
+                except Exception:
+                    self.logger.exception("Unable to process packet: %s", packet)
+            # Let the transport and process add newer packets, which may belong to a higher priority lane
+            await asyncio.sleep(0)
 
     async def _execute(self, packet: str):
         """
@@ -204,16 +308,17 @@ class Connection:
             else:
                 self._state = SignalRConnectionState.ONLINE
                 self.connection_established.set_result(SignalRConnectionState.ONLINE)
-                await self.on_start()
+                # Not awaited, on_start may invoke and wait for completions which are dispatched after this
+                asyncio.get_running_loop().create_task(self.on_start())
         else:
             message: messages.BaseSignalRMessage = self.protocol.parse(packet)
             if message.type is messages.SignalRMessageType.INVOCATION:
                 message: messages.InvocationMessage
-                self.logger.info(f"INVOKE: {message}")
+                self.logger.info("INVOKE: %s", message)
                 await self._call_handlers(message)
             elif message.type is messages.SignalRMessageType.COMPLETION:
                 message: messages.CompletionMessage
-                self.logger.info(f"COMPLETION: {message}")
+                self.logger.info("COMPLETION: %s", message)
                 self._set_completion(message)
 
     def on_online(self):
@@ -248,26 +353,67 @@ class Connection:
         # Encode and send message
         encoded_message = self.protocol.encode(message)
         await self.transport.send(encoded_message)
-        self.logger.debug(f"PING: {encoded_message}")
+        self.logger.debug("PING: %s", encoded_message)
 
     async def invoke(self, target: str, *args: typing.Any) -> futures.InvokeCompletionFuture:
         """
         Sends Upstream Invokes with arguments
         """
         # Assemble message
+        arguments = list(args)
+        codec = self._codecs.get(target)
+        if codec is not None:
+            arguments = codec.encode(arguments)
         message = messages.InvocationMessage(invocation_id=str(uuid.uuid4()),
                                              target=target,
-                                             arguments=list(args))
+                                             arguments=arguments)
         # Prepare Completion Future
-        invoke_future = futures.InvokeCompletionFuture(message.invocation_id)
+        invoke_future = futures.InvokeCompletionFuture(message.invocation_id, loop=asyncio.get_running_loop())
         ret: futures.InvokeCompletionFuture = self._register_completion_futures(invoke_future)
         # Encode and send message
         encoded_message = self.protocol.encode(message)
-        self.logger.info(f"INVOKE: {encoded_message}")
+        self.logger.info("INVOKE: %s", encoded_message)
         # Send packet
         await self.transport.send(encoded_message)
         return ret
 
+    def register_codec(self, target: str, codec: typing.Optional[codecs.BaseArgumentCodec]):
+        """
+        Register the codec converting the arguments of a target, for both incoming events and invokes
+        Note: Passing None removes the codec of the target
+        """
+        if codec is None:
+            self._codecs.pop(target, None)
+        else:
+            self._codecs[target] = codec
+
+    def register_schema(self, target: str, *types: typing.Any,
+                        field_name: typing.Optional[typing.Callable[[str], str]] = None) -> codecs.TypedArgumentCodec:
+        """
+        Compiles and registers a typed codec so handlers of the target receive instances of the given types
+        Note: Types may be dataclasses, NamedTuples or classes with type hinted fields (see codecs.TypedArgumentCodec)
+        """
+        codec = codecs.TypedArgumentCodec(*types, field_name=field_name)
+        self.register_codec(target, codec)
+        return codec
+
+    def register_conflation(self, target: str, key: conflation.ConflationKey = None) -> conflation.Conflator:
+        """
+        Marks a target as conflated, handlers only see the newest message while they are busy
+        - key: None for the whole target, the index of an argument (e.g. instrument id) or a callable receiving the
+          arguments and returning the key
+        Note: The returned Conflator exposes the merged/delivered counters
+        """
+        conflator = conflation.Conflator(key)
+        self._conflators[target] = conflator
+        return conflator
+
+    def unregister_conflation(self, target: str):
+        """
+        Dispatches every message of the target again
+        """
+        self._conflators.pop(target, None)
+
     def on(self, event: str, callback: typing.Coroutine):
         """
         Register an async handler for a given event.
@@ -285,10 +431,10 @@ class Connection:
         """
         if event in self._handlers:
             if callback is None:
-                self.logger.info(f"Removing ALL event handler for {event}")
+                self.logger.info("Removing ALL event handler for %s", event)
                 self._handlers.pop(event)
             else:
                 for handler in self._handlers.get('event', []):
                     if handler == callback:
-                        self.logger.info(f"Removing an event handler for {event}")
+                        self.logger.info("Removing an event handler for %s", event)
                         self._handlers[event].remove(handler)
@@ -0,0 +1,73 @@
+import typing
+
+from async_signalr_client.connection import Connection, SignalRConnectionState
+from async_signalr_client.models import messages
+from async_signalr_client.transports.shared_memory import SharedMemoryRing, TEXT, BYTES
+
+
+class FanoutConnection(Connection):
+    """
+    Connection owning the socket for several local processes
+    - Every message received after the handshake is published, still encoded, to a shared-memory ring
+    - Subscriber processes read the ring with Connection(ring_name, transport=SharedMemoryTransport) and keep their
+      own handlers, the message is decoded only by the processes that consume it
+    - With dispatch_locally, messages are also decoded here so local handlers are called and completions of the
+      invokes of this connection are resolved, otherwise this process only frames and publishes
+    - Every `slow_reader_check_every` records, subscribers lagging more than `slow_reader_threshold` of the ring
+      are logged
+    """
+
+    def __init__(self,
+                 url: str,
+                 ring_name: typing.Optional[str] = None,
+                 ring_capacity: int = 2**24,
+                 max_readers: int = 16,
+                 slow_reader_threshold: float = 0.5,
+                 slow_reader_check_every: int = 4096,
+                 dispatch_locally: bool = True,
+                 **kwargs):
+        super().__init__(url, **kwargs)
+        self.ring = SharedMemoryRing.create(ring_name, ring_capacity, max_readers)
+        self.slow_reader_threshold = slow_reader_threshold
+        self.slow_reader_check_every = slow_reader_check_every
+        self.dispatch_locally = dispatch_locally
+        self._published = 0
+        self._slow_readers: typing.Set[int] = set()
+
+    @property
+    def ring_name(self) -> str:
+        return self.ring.name
+
+    def _publish(self, packet: typing.Union[str, bytes]):
+        if isinstance(packet, str):
+            self.ring.publish(packet.encode(), TEXT)
+        else:
+            self.ring.publish(packet, BYTES)
+        self._published += 1
+        if self._published % self.slow_reader_check_every == 0:
+            self._check_readers()
+
+    def _check_readers(self):
+        slow = set(self.ring.slow_readers(self.slow_reader_threshold))
+        for pid in slow - self._slow_readers:
+            self.logger.warning("Fan-out subscriber pid:%s is falling behind on ring %s", pid, self.ring_name)
+        self._slow_readers = slow
+
+    async def _execute(self, packet: typing.Union[str, bytes]):
+        if self.state is SignalRConnectionState.CONNECTING:
+            self.ring.set_handshake(packet.encode() if isinstance(packet, str) else packet,
+                                    TEXT if isinstance(packet, str) else BYTES)
+        else:
+            self._publish(packet)
+            if not self.dispatch_locally:
+                return
+        await super()._execute(packet)
+
+    async def _call_handlers(self, message: messages.InvocationMessage):
+        # Events are usually handled by the subscribers only, do not warn about missing local handlers
+        if message.target in self._handlers:
+            await super()._call_handlers(message)
+
+    async def stop(self):
+        await super().stop()
+        self.ring.close()
@@ -0,0 +1,107 @@
+import time
+import typing
+import asyncio
+import collections
+from enum import IntEnum
+
+from async_signalr_client.models import messages
+
+
+class Lane(IntEnum):
+    """
+    Dispatch lanes, in priority order
+    """
+    CONTROL = 0  # Handshake, completions of our own invokes, pings and close messages
+    INVOCATION = 1  # Everything else, mostly server invocations
+
+
+CONTROL_TYPES = frozenset({messages.SignalRMessageType.COMPLETION,
+                           messages.SignalRMessageType.PING,
+                           messages.SignalRMessageType.CLOSE})
+
+DEFAULT_WEIGHTS = {Lane.CONTROL: 64, Lane.INVOCATION: 32}
+
+
+class LaneMetrics:
+    """
+    Counters of a lane
+    - wait: Time between a packet being framed and being dispatched
+    """
+    __slots__ = ("enqueued", "dispatched", "max_depth", "total_wait_s", "max_wait_s")
+
+    def __init__(self):
+        self.enqueued = 0
+        self.dispatched = 0
+        self.max_depth = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+
+    @property
+    def mean_wait_s(self) -> float:
+        return self.total_wait_s / self.dispatched if self.dispatched else 0.0
+
+    def __repr__(self):
+        return (f"LaneMetrics(enqueued={self.enqueued}, dispatched={self.dispatched}, max_depth={self.max_depth}, "
+                f"mean_wait_s={self.mean_wait_s:.6f}, max_wait_s={self.max_wait_s:.6f})")
+
+
+class PriorityLanes:
+    """
+    Holds framed packets per lane until the connection dispatches them
+    - weights: Maximum packets taken from each lane per dispatch round, a round always starts with the CONTROL lane
+    """
+
+    def __init__(self, weights: typing.Optional[typing.Dict[Lane, int]] = None):
+        self.weights = dict(DEFAULT_WEIGHTS)
+        self.weights.update(weights or {})
+        if any(x < 1 for x in self.weights.values()):
+            raise ValueError("Lane weights must be greater or equal than 1")
+        self.metrics: typing.Dict[Lane, LaneMetrics] = {lane: LaneMetrics() for lane in Lane}
+        self._queues: typing.Dict[Lane, typing.Deque[typing.Tuple[float, typing.Any]]] = {
+            lane: collections.deque() for lane in Lane}
+        self._ready: typing.Optional[asyncio.Event] = None
+
+    @property
+    def ready(self) -> asyncio.Event:
+        """
+        Event set when packets are waiting
+        """
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        return self._ready
+
+    def __len__(self):
+        return sum(len(x) for x in self._queues.values())
+
+    def lane_of(self, message_type: typing.Optional[messages.SignalRMessageType]) -> Lane:
+        return Lane.CONTROL if message_type in CONTROL_TYPES else Lane.INVOCATION
+
+    def put(self, lane: Lane, packet: typing.Any):
+        queue = self._queues[lane]
+        queue.append((time.monotonic(), packet))
+        metrics = self.metrics[lane]
+        metrics.enqueued += 1
+        if len(queue) > metrics.max_depth:
+            metrics.max_depth = len(queue)
+
+    def next_round(self) -> typing.List[typing.Any]:
+        """
+        Takes the packets of one dispatch round, up to the weight of each lane in priority order
+        """
+        now = time.monotonic()
+        packets = []
+        for lane in Lane:
+            queue = self._queues[lane]
+            if not queue:
+                continue
+            metrics = self.metrics[lane]
+            count = min(self.weights[lane], len(queue))
+            metrics.dispatched += count
+            for _ in range(count):
+                enqueued_at, packet = queue.popleft()
+                wait = now - enqueued_at
+                metrics.total_wait_s += wait
+                if wait > metrics.max_wait_s:
+                    metrics.max_wait_s = wait
+                packets.append(packet)
+        return packets
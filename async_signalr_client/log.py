@@ -0,0 +1,85 @@
+import typing
+import logging
+
+LOGGER_NAME = "AsyncSignalRClient"
+
+_handler: typing.Optional[logging.Handler] = None
+
+
+def attach_handler(level: int = logging.DEBUG) -> logging.Handler:
+    """
+    Attaches a StreamHandler to the async_signalr_client logger once per process
+    Note: Further calls only lower the handler level, so N connections never print a line N times
+    """
+    global _handler
+    if _handler is None:
+        _handler = logging.StreamHandler()
+        _handler.setLevel(level)
+        logging.getLogger(LOGGER_NAME).addHandler(_handler)
+    elif level < _handler.level:
+        _handler.setLevel(level)
+    return _handler
+
+
+class _Truncated:
+    """
+    Defers payload truncation and formatting until a log record is actually emitted
+    """
+    __slots__ = ("payload", "max_length")
+
+    def __init__(self, payload: typing.Any, max_length: int):
+        self.payload = payload
+        self.max_length = max_length
+
+    def __str__(self):
+        payload = self.payload
+        if isinstance(payload, (bytes, bytearray, memoryview)):
+            if self.max_length:
+                payload = payload[:self.max_length + 1]
+            payload = bytes(payload).decode(errors="replace")
+        elif not isinstance(payload, str):
+            payload = str(payload)
+        if self.max_length and len(payload) > self.max_length:
+            return f"{payload[:self.max_length]}...[truncated]"
+        return payload
+
+
+class WireLogger:
+    """
+    Logs raw wire payloads at DEBUG level
+    - Nothing is formatted unless DEBUG is enabled for the logger
+    - Only one out of every `sample_every` payloads is logged
+    - Payloads longer than `max_length` characters are truncated (0 disables truncation)
+    """
+
+    def __init__(self, logger: logging.Logger, sample_every: int = 1, max_length: int = 512):
+        self.logger = logger
+        self.sample_every = 1
+        self.max_length = 0
+        self._count = 0
+        self.configure(sample_every, max_length)
+
+    def configure(self, sample_every: int = 1, max_length: int = 512):
+        """
+        Updates sampling and truncation settings
+        """
+        if sample_every < 1:
+            raise ValueError("sample_every must be greater or equal than 1")
+        self.sample_every = sample_every
+        self.max_length = max_length
+
+    @property
+    def enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def log(self, direction: str, payload: typing.Any):
+        """
+        Logs a payload travelling in the given direction (e.g. Sent/Received)
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if self.sample_every > 1:
+            self._count += 1
+            if self._count % self.sample_every:
+                return
+        self.logger.debug("%s: %s", direction, _Truncated(payload, self.max_length))
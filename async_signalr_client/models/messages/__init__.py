@@ -1,7 +1,7 @@
 from .types import SignalRMessageType
 from .base import BaseMessage, BaseSignalRMessage
 from .handshakes import HandshakeIncomingMessage, HandshakeOutgoingMessage
-from .invocation import InvocationMessage
+from .invocation import InvocationMessage, LazyInvocationMessage
 from .stream_item import StreamItemMessage
 from .completion import CompletionMessage
 from .stream_invocation import StreamInvocationMessage
@@ -16,6 +16,7 @@ __all__ = [
     "HandshakeIncomingMessage",
     "HandshakeOutgoingMessage",
     "InvocationMessage",
+    "LazyInvocationMessage",
     "StreamItemMessage",
     "CompletionMessage",
     "StreamInvocationMessage",
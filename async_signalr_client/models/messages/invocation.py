@@ -12,3 +12,43 @@ class InvocationMessage(BaseSignalRMessage):
         self.invocation_id = invocation_id
         self.target = target
         self.arguments = arguments
+
+
+_PENDING = object()
+
+
+class LazyInvocationMessage(InvocationMessage):
+    """
+    Invocation message whose arguments are only decoded the first time they are accessed
+    - raw: Packet the message was parsed from
+    - arguments_offset: Position in raw where the encoded arguments start
+    - decoder: Callable decoding the arguments from (raw, arguments_offset)
+    """
+
+    def __init__(self,
+                 invocation_id: str,
+                 target: str,
+                 raw: typing.Any,
+                 arguments_offset: int,
+                 decoder: typing.Callable[[typing.Any, int], typing.List[typing.Any]]):
+        self.raw = raw
+        self.arguments_offset = arguments_offset
+        self._decoder = decoder
+        super().__init__(invocation_id, target, _PENDING)
+
+    @property
+    def arguments(self) -> typing.List[typing.Any]:
+        if self._arguments is _PENDING:
+            self._arguments = self._decoder(self.raw, self.arguments_offset)
+        return self._arguments
+
+    @arguments.setter
+    def arguments(self, value: typing.List[typing.Any]):
+        self._arguments = value
+
+    @property
+    def decoded(self) -> bool:
+        """
+        Determines if the arguments have already been decoded
+        """
+        return self._arguments is not _PENDING
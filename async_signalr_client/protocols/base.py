@@ -1,3 +1,4 @@
+import typing
 from async_signalr_client.models import messages
 
 
@@ -36,6 +37,13 @@ class BaseSignalRProtocol:
         """
         raise NotImplementedError("Implementation Required")
 
+    def message_type(self, raw) -> typing.Optional[messages.SignalRMessageType]:
+        """
+        Cheaply determines the type of a raw packet without decoding it, None when it cannot be told
+        Note: Used to prioritize packets only, parse() remains the authority on the message type
+        """
+        return None
+
     def encode(self, message: messages.BaseSignalRMessage):
         """
         This method should encode a SignalRMessage into a protocol standard payload
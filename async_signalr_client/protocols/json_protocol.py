@@ -1,4 +1,7 @@
+import re
 import json
+import typing
+import base64
 from async_signalr_client.models import messages
 from async_signalr_client import protocols, exceptions
 
@@ -12,6 +15,9 @@ class JsonEncoder(json.JSONEncoder):
         # Return Message Type Integer
         if isinstance(obj, messages.SignalRMessageType):
             return obj.value
+        # Binary data is transferred as base64 strings
+        if isinstance(obj, (bytes, bytearray, memoryview)):
+            return base64.b64encode(obj).decode()
         # Normalize Invocation Id Property
         if "invocation_id" in obj.__dict__:
             obj.__dict__["invocationId"] = obj.__dict__["invocation_id"]
@@ -25,8 +31,18 @@ class JsonProtocol(protocols.BaseSignalRProtocol):
     Reference: https://github.com/aspnet/AspNetCore/blob/master/src/SignalR/docs/specs/HubProtocol.md
     """
 
-    def __init__(self):
+    ARGUMENTS_KEY = re.compile(r'"arguments"\s*:\s*')
+    TYPE_KEY = re.compile(r'"type"\s*:\s*(\d+)')
+    TYPE_SEARCH_LENGTH = 64
+
+    def __init__(self, lazy_arguments: bool = False):
+        """
+        - lazy_arguments: Decode only the envelope (type, target, invocationId) of invocation messages and defer
+          decoding the arguments until they are accessed
+        """
         super().__init__("json", 1, chr(0x1E))
+        self.lazy_arguments = lazy_arguments
+        self._decoder = json.JSONDecoder()
 
     def _escape(self, raw: str) -> str:
         return raw.replace(self.separator, "")
@@ -56,10 +72,64 @@ class JsonProtocol(protocols.BaseSignalRProtocol):
         except (TypeError, json.decoder.JSONDecodeError):
             raise exceptions.SignalRInvalidMessageError(f"Unable to decode message.\n{raw}")
 
+    def _decode_arguments(self, raw: str, offset: int) -> list:
+        """
+        Decodes the arguments array starting at the given offset of a raw packet
+        """
+        try:
+            return self._decoder.raw_decode(raw, offset)[0]
+        except json.decoder.JSONDecodeError:
+            raise exceptions.SignalRInvalidMessageError(f"Unable to decode message arguments.\n{raw}")
+
+    def _parse_envelope(self, raw) -> messages.LazyInvocationMessage:
+        """
+        Parses the fields preceding the arguments of an invocation message, leaving the arguments undecoded
+        Note: Returns None when the packet does not have the expected layout so that it is fully parsed instead
+        """
+        if not isinstance(raw, str):
+            return None
+        match = self.ARGUMENTS_KEY.search(raw)
+        if match is None:
+            return None
+        head = raw[:match.start()].rstrip()
+        if head.endswith(","):
+            head = head[:-1]
+        try:
+            envelope = json.loads(head + "}")
+        except json.decoder.JSONDecodeError:
+            return None
+        if not isinstance(envelope, dict) or "target" not in envelope:
+            return None
+        if envelope.get("type") != messages.SignalRMessageType.INVOCATION.value:
+            return None
+        return messages.LazyInvocationMessage(invocation_id=envelope.get('invocationId', None),
+                                              target=envelope["target"],
+                                              raw=raw,
+                                              arguments_offset=match.end(),
+                                              decoder=self._decode_arguments)
+
+    def message_type(self, raw) -> typing.Optional[messages.SignalRMessageType]:
+        """
+        Looks for the type property within the first TYPE_SEARCH_LENGTH characters, where servers write it
+        """
+        if not isinstance(raw, str):
+            return None
+        match = self.TYPE_KEY.search(raw, 0, self.TYPE_SEARCH_LENGTH)
+        if match is None:
+            return None
+        try:
+            return messages.SignalRMessageType(int(match.group(1)))
+        except ValueError:
+            return None
+
     def parse(self, raw) -> messages.BaseSignalRMessage:
         """
         Parse downstream packets into async_signalr_client models
         """
+        if self.lazy_arguments:
+            message = self._parse_envelope(raw)
+            if message is not None:
+                return message
         # Convert packet into a python object
         decoded_payload = self.decode(raw)
         # Retrieve message type
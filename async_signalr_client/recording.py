@@ -0,0 +1,139 @@
+"""
+Records the raw frames a transport hands to a connection and replays them offline
+File format: MAGIC followed by one record per frame
+- Record header: offset in seconds since the recording started (double), kind (text/bytes), payload length
+- Record payload: UTF-8 text or raw bytes
+"""
+import time
+import struct
+import typing
+import asyncio
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from async_signalr_client.connection import Connection
+
+MAGIC = b"SIGNALR-REC\x01"
+_HEADER = struct.Struct("<dBI")
+_TEXT = 0
+_BYTES = 1
+
+Frame = typing.Union[str, bytes]
+
+
+class WireRecorder:
+    """
+    Appends frames with their timestamps to a recording file
+    Note: Frames are buffered by the file object, call flush() to persist them while recording
+    """
+
+    def __init__(self, path: str, buffering: int = 2**16):
+        self.path = path
+        self.frames = 0
+        self._file = open(path, "ab", buffering=buffering)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._start = time.monotonic()
+
+    def record(self, data: Frame):
+        """
+        Appends a frame to the recording
+        """
+        if isinstance(data, str):
+            payload, kind = data.encode(), _TEXT
+        else:
+            payload, kind = data, _BYTES
+        self._file.write(_HEADER.pack(time.monotonic() - self._start, kind, len(payload)))
+        self._file.write(payload)
+        self.frames += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class RecordingQueue(asyncio.Queue):
+    """
+    Event queue that records every frame put by the transport before it reaches the connection
+    """
+
+    def __init__(self, recorder: WireRecorder, maxsize: int = 0):
+        super().__init__(maxsize)
+        self.recorder = recorder
+
+    def _put(self, item):
+        self.recorder.record(item)
+        super()._put(item)
+
+
+def read_recording(path: str) -> typing.Iterator[typing.Tuple[float, Frame]]:
+    """
+    Yields (offset_s, frame) for every frame of a recording, text frames are yielded as str
+    Note: Recordings appended by several sessions restart their offsets at 0
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a SignalR recording")
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            offset, kind, length = _HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length:
+                return  # Truncated last record, the recording was interrupted while writing
+            yield offset, payload.decode() if kind == _TEXT else payload
+
+
+async def replay(connection: "Connection", path: str, speed: typing.Optional[float] = None) -> int:
+    """
+    Feeds a recording through Connection.process and the connection protocol, returns the number of frames replayed
+    - speed: 1 replays at the original pace, 2 twice as fast... None replays as fast as possible
+    Note: The connection must not be started, the recording is expected to begin with the handshake response
+    Note: Returns once every frame has been processed and the tasks dispatched for them are done
+    """
+    from async_signalr_client.connection import SignalRConnectionState
+
+    loop = asyncio.get_running_loop()
+    existing_tasks = asyncio.all_tasks()
+    connection._state = SignalRConnectionState.CONNECTING
+    process_task = loop.create_task(connection.process())
+    queue = connection.event_queue
+    frames = 0
+    start = time.monotonic()
+    previous = 0.0
+    for offset, frame in read_recording(path):
+        if speed:
+            if offset < previous:
+                start = time.monotonic() - offset / speed  # Appended session, offsets restart
+            previous = offset
+            delay = start + offset / speed - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        queue.put_nowait(frame)
+        frames += 1
+        if not speed and frames % 1024 == 0:
+            await asyncio.sleep(0)  # Let process keep up so the queue does not hold the whole recording
+    while not queue.empty() or connection.lanes:
+        await asyncio.sleep(0)
+    # Wait for the tasks dispatched by process and the handlers they started
+    ignored = existing_tasks | {process_task, asyncio.current_task()}
+    pending = asyncio.all_tasks() - ignored
+    while pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        ignored |= pending
+        pending = asyncio.all_tasks() - ignored
+    process_task.cancel()
+    try:
+        await process_task
+    except asyncio.CancelledError:
+        pass
+    return frames
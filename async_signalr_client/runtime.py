@@ -0,0 +1,48 @@
+import typing
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None
+
+T = typing.TypeVar("T")
+
+
+def uvloop_available() -> bool:
+    """
+    Determines if uvloop is installed (pip install async-signalr-client[uvloop])
+    """
+    return uvloop is not None
+
+
+def new_event_loop(use_uvloop: bool = False) -> asyncio.AbstractEventLoop:
+    """
+    Creates an event loop, backed by uvloop if requested
+    """
+    if use_uvloop:
+        if uvloop is None:
+            raise ImportError("uvloop is not installed, install it with: pip install async-signalr-client[uvloop]")
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run(main: typing.Awaitable[T], use_uvloop: bool = False) -> T:
+    """
+    Runs a coroutine in a new event loop until it completes, similar to asyncio.run
+    Note: Connections may be created before calling run as they only bind to the loop once started
+    """
+    loop = new_event_loop(use_uvloop)
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
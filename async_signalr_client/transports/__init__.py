@@ -1,9 +1,29 @@
 from .base_transport import BaseTransport
 from .websocket_transport import WebSocketTransport
+from .server_sent_events_transport import ServerSentEventsTransport
 from .long_polling_transport import LongPollingTransport
+from .registry import register_transport, get_transport, registered_transports
+from .auto_transport import AutoTransport, NegotiationCache
+from .network import NetworkContext, CachingResolver, create_ssl_context
+from .shared_memory import SharedMemoryTransport, SharedMemoryRing
+
+register_transport("WebSockets", WebSocketTransport)
+register_transport("ServerSentEvents", ServerSentEventsTransport)
+register_transport("LongPolling", LongPollingTransport)
 
 __all__ = [
     "BaseTransport",
     "WebSocketTransport",
-    "LongPollingTransport"
+    "ServerSentEventsTransport",
+    "LongPollingTransport",
+    "AutoTransport",
+    "NegotiationCache",
+    "NetworkContext",
+    "CachingResolver",
+    "create_ssl_context",
+    "SharedMemoryTransport",
+    "SharedMemoryRing",
+    "register_transport",
+    "get_transport",
+    "registered_transports"
 ]
@@ -0,0 +1,145 @@
+import time
+import typing
+import asyncio
+from urllib import parse
+from async_signalr_client.protocols import BaseSignalRProtocol
+from async_signalr_client.exceptions import SignalRConnectionError
+from async_signalr_client.transports.base_transport import BaseTransport
+from async_signalr_client.transports.registry import get_transport
+
+
+class NegotiationCache:
+    """
+    Remembers, per host, which transport connected successfully so that later connections try it first
+    """
+
+    def __init__(self, ttl_s: float = 300):
+        self.ttl_s = ttl_s
+        self._entries: typing.Dict[str, typing.Tuple[str, float]] = dict()
+
+    def get(self, host: str) -> typing.Optional[str]:
+        """
+        Returns the transport name cached for the host unless it has expired
+        """
+        entry = self._entries.get(host)
+        if entry is None:
+            return None
+        name, expires = entry
+        if expires <= time.monotonic():
+            del self._entries[host]
+            return None
+        return name
+
+    def set(self, host: str, name: str):
+        self._entries[host] = (name, time.monotonic() + self.ttl_s)
+
+    def invalidate(self, host: typing.Optional[str] = None):
+        """
+        Forgets the transport cached for the host, or for every host if not specified
+        """
+        if host is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(host, None)
+
+
+# Shared by every AutoTransport unless a cache is given explicitly
+default_cache = NegotiationCache()
+
+
+class AutoTransport(BaseTransport):
+    """
+    Selects the first transport, in order of preference, that both the server and the network path support
+    - Available transports are read from a single negotiate request and tried in order
+    - The winning transport is cached per host so later connections and reconnects skip failed attempts
+    """
+    DEFAULT_TRANSPORTS = ("WebSockets", "ServerSentEvents", "LongPolling")
+
+    def __init__(self,
+                 url: str,
+                 transports: typing.Sequence[str] = DEFAULT_TRANSPORTS,
+                 options: typing.Optional[typing.Dict[str, typing.Dict[str, typing.Any]]] = None,
+                 cache: typing.Optional[NegotiationCache] = None,
+                 attempt_timeout_s: float = 10,
+                 network=None):
+        """
+        - transports: Names of the transports to try, in order of preference
+        - options: Keyword arguments for each transport, by transport name
+        - cache: Negotiation cache, defaults to the one shared by the process
+        - attempt_timeout_s: Maximum time given to each transport to connect
+        - network: Network context shared with the transports tried (see transports.network.NetworkContext)
+        """
+        super().__init__(url, 'Auto', network)
+        self.raw_url = url
+        self.host = parse.urlparse(url).netloc
+        self.transports = list(transports)
+        self.options = options or dict()
+        self.cache = default_cache if cache is None else cache
+        self.attempt_timeout_s = attempt_timeout_s
+        self.transport: typing.Optional[BaseTransport] = None  # Selected transport
+
+    def _build(self, name: str) -> BaseTransport:
+        options = self.options.get(name, {})
+        if self.network is not None:
+            options = dict(dict(network=self.network), **options)
+        transport = get_transport(name)(self.raw_url, **options)
+        transport.wire_logger.configure(self.wire_logger.sample_every, self.wire_logger.max_length)
+        return transport
+
+    async def _attempt(self, name: str, negotiation: typing.Optional[dict], *args) -> bool:
+        """
+        Tries to connect with the given transport, the transport is kept when it succeeds
+        """
+        transport = self._build(name)
+        transport.negotiation = negotiation
+        try:
+            await asyncio.wait_for(transport.connect(*args), self.attempt_timeout_s)
+        except Exception as e:
+            self.logger.warning("%s transport failed to connect to %s: %r", name, self.host, e)
+            try:
+                await transport.stop()
+            except Exception:
+                pass
+            return False
+        self.transport = transport
+        self.connection_id = transport.connection_id
+        self.cache.set(self.host, name)
+        return True
+
+    async def connect(self,
+                      protocol: BaseSignalRProtocol,
+                      queue: asyncio.Queue,
+                      on_online: typing.Optional[typing.Callable[[None], None]] = None,
+                      on_offline: typing.Optional[typing.Callable[[None], None]] = None):
+        """
+        Connects with the cached transport of the host or falls back through the available transports
+        """
+        args = (protocol, queue, on_online, on_offline)
+        cached = self.cache.get(self.host)
+        if cached is not None and cached in self.transports:
+            if await self._attempt(cached, None, *args):
+                return
+            self.cache.invalidate(self.host)
+
+        negotiation = await self.negotiate()
+        available = {x.get('transport', '') for x in negotiation.get('availableTransports', [])}
+        candidates = [x for x in self.transports if x in available and x != cached]
+        for name in candidates:
+            # The first attempt reuses the negotiate response, later ones negotiate a fresh connection id
+            if await self._attempt(name, negotiation, *args):
+                return
+            negotiation = None
+        raise SignalRConnectionError(f"Unable to connect to {self.host} with any of the transports: {candidates}")
+
+    async def receive(self, queue: asyncio.Queue):
+        await self.transport.receive(queue)
+
+    async def send(self, packet):
+        if self.transport is None:
+            raise SignalRConnectionError("Unable to send packet as connection has not been established")
+        await self.transport.send(packet)
+
+    async def stop(self):
+        self.stop_event.set()
+        if self.transport:
+            await self.transport.stop()
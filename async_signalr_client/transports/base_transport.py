@@ -3,9 +3,13 @@ import asyncio
 import aiohttp
 import logging
 from urllib import parse
+from async_signalr_client.log import WireLogger
 from async_signalr_client.protocols import BaseSignalRProtocol
 from async_signalr_client.exceptions import SignalRConnectionError
 
+if typing.TYPE_CHECKING:
+    from async_signalr_client.transports.network import NetworkContext
+
 
 class BaseTransport:
     SECURE_SCHEME = 'https'
@@ -13,27 +17,43 @@ class BaseTransport:
 
     def __init__(self,
                  url: str,
-                 transport_name: str):
+                 transport_name: str,
+                 network: typing.Optional["NetworkContext"] = None):
+        """
+        - network: Shared SSL context, DNS cache and keep-alive pool (see transports.network.NetworkContext)
+        """
         self.url = self.normalize_url_scheme(url)
+        self.network = network
         self.conn = None  # Will hold async_signalr_client connection
         self.transport_name = transport_name
         self.logger = logging.getLogger(f"AsyncSignalRClient-{transport_name}Transport")
+        self.wire_logger = WireLogger(self.logger)  # Sampled and truncated payload logging
         self.connection_id = None
-        self.stop_event = asyncio.Event()  # Event to notify that processing should stop
+        self._stop_event: typing.Optional[asyncio.Event] = None
         self.receive_task = None  # This will hold the reference to the task receiving packets
         self.connection_state = None
         self.on_online = None
         self.on_offline = None
+        self.negotiation: typing.Optional[dict] = None  # Negotiate response to use instead of requesting one
+
+    @property
+    def stop_event(self) -> asyncio.Event:
+        """
+        Event to notify that processing should stop, created on first use so transports can be built outside a loop
+        """
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        return self._stop_event
 
     @staticmethod
     def _assemble_negotiate_url(url: str):
         parsed_url = parse.urlparse(url)
         scheme = parsed_url.scheme
         if 'http' not in scheme:
-            if 'ws' in scheme:
-                scheme = 'http'
-            elif 'wss' in scheme:
+            if 'wss' in scheme:
                 scheme = 'https'
+            elif 'ws' in scheme:
+                scheme = 'http'
             else:
                 raise SignalRConnectionError(f"Unsupported scheme: {scheme}")
 
@@ -44,21 +64,50 @@ class BaseTransport:
                                  parsed_url.query,
                                  parsed_url.fragment))
 
+    async def negotiate(self) -> dict:
+        """
+        Requests the connection id and the transports available on the server
+        """
+        if self.network is not None:
+            async with self.network.session.post(self._assemble_negotiate_url(self.url)) as r:
+                response = await r.json()
+        else:
+            async with aiohttp.ClientSession() as session:
+                r = await session.post(self._assemble_negotiate_url(self.url))
+                response = await r.json()
+        if self.logger:
+            self.logger.debug("Available transports: %s", response)
+        return response
+
     async def validate_transport(self):
         """
         Ensures transport is compatible with server
+        Note: A negotiate response previously assigned to self.negotiation is used (once) instead of requesting one
         """
-        async with aiohttp.ClientSession() as session:
-            r = await session.post(self._assemble_negotiate_url(self.url))
-            response = await r.json()
-            if self.logger:
-                self.logger.debug(f"Available transports: {response}")
-            for protocol in response.get('availableTransports', []):
-                if self.transport_name == protocol.get('transport', ''):
-                    self.connection_id = response.get('connectionId', None)
-                    return True
+        response, self.negotiation = self.negotiation, None
+        if response is None:
+            response = await self.negotiate()
+        for protocol in response.get('availableTransports', []):
+            if self.transport_name == protocol.get('transport', ''):
+                self.connection_id = response.get('connectionId', None)
+                return True
         return False
 
+    def _client_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared session of the network context or a new session owned by the transport
+        """
+        if self.network is not None:
+            return self.network.session
+        return aiohttp.ClientSession()
+
+    async def _close_client_session(self):
+        """
+        Closes the transport session unless it belongs to a shared network context
+        """
+        if self.conn is not None and (self.network is None or self.conn is not self.network.session):
+            await self.conn.close()
+
     async def connect(self,
                       protocol: BaseSignalRProtocol,
                       queue: asyncio.Queue,
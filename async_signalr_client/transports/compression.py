@@ -0,0 +1,61 @@
+import typing
+from websockets import frames
+from websockets.extensions.permessage_deflate import PerMessageDeflate, ClientPerMessageDeflateFactory
+
+
+class ThresholdPerMessageDeflate(PerMessageDeflate):
+    """
+    Per-Message Deflate extension that sends messages smaller than a threshold uncompressed
+    Note: RFC 7692 allows any message to be sent without compression, the rsv1 bit tells the peer which is which
+    """
+
+    def __init__(self, *args: typing.Any, threshold: int = 0, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+
+    def encode(self, frame: frames.Frame) -> frames.Frame:
+        if frame.fin and frame.opcode not in frames.CTRL_OPCODES and frame.opcode is not frames.Opcode.CONT:
+            if len(frame.data) < self.threshold:
+                return frame
+        return super().encode(frame)
+
+
+class ThresholdPerMessageDeflateFactory(ClientPerMessageDeflateFactory):
+    """
+    Negotiates Per-Message Deflate and builds ThresholdPerMessageDeflate extensions
+    """
+
+    def __init__(self, *args: typing.Any, threshold: int = 0, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+
+    def process_response_params(self, params, accepted_extensions) -> PerMessageDeflate:
+        extension = super().process_response_params(params, accepted_extensions)
+        return ThresholdPerMessageDeflate(extension.remote_no_context_takeover,
+                                          extension.local_no_context_takeover,
+                                          extension.remote_max_window_bits,
+                                          extension.local_max_window_bits,
+                                          extension.compress_settings,
+                                          threshold=self.threshold)
+
+
+def deflate_factory(client_max_window_bits: typing.Optional[int] = None,
+                    server_max_window_bits: typing.Optional[int] = None,
+                    memory_level: typing.Optional[int] = None,
+                    compression_level: typing.Optional[int] = None,
+                    threshold: int = 0) -> ClientPerMessageDeflateFactory:
+    """
+    Builds the Per-Message Deflate factory offered to the server during the websocket handshake
+    - client_max_window_bits/server_max_window_bits: LZ77 window of each direction (8-15), smaller uses less memory
+    - memory_level: zlib memLevel (1-9) used for compression, smaller uses less memory
+    - compression_level: zlib level (0-9), smaller uses less CPU
+    - threshold: Messages smaller than this number of bytes are sent uncompressed
+    """
+    compress_settings = {"memLevel": 5 if memory_level is None else memory_level}
+    if compression_level is not None:
+        compress_settings["level"] = compression_level
+    return ThresholdPerMessageDeflateFactory(
+        client_max_window_bits=True if client_max_window_bits is None else client_max_window_bits,
+        server_max_window_bits=server_max_window_bits,
+        compress_settings=compress_settings,
+        threshold=threshold)
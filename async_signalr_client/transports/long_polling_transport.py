@@ -1,6 +1,5 @@
 import typing
 import asyncio
-import aiohttp
 from async_signalr_client.protocols import BaseSignalRProtocol
 from async_signalr_client.exceptions import SignalRConnectionError
 from async_signalr_client.transports.base_transport import BaseTransport
@@ -14,8 +13,8 @@ class LongPollingTransport(BaseTransport):
     SECURE_SCHEME = 'https'
     UNSECURE_SCHEME = 'http'
 
-    def __init__(self, url):
-        super().__init__(url, 'LongPolling')
+    def __init__(self, url, network=None):
+        super().__init__(url, 'LongPolling', network)
         self.last_connection_callback = None
 
     async def connect(self,
@@ -33,8 +32,8 @@ class LongPollingTransport(BaseTransport):
             raise SignalRConnectionError(f"{self.transport_name} transport not available...")
 
         if self.conn is None:
-            self.conn = aiohttp.ClientSession()
-        loop = asyncio.get_event_loop()
+            self.conn = self._client_session()
+        loop = asyncio.get_running_loop()
         self.receive_task = loop.create_task(self.receive(queue))
         await self.send(protocol.encode(protocol.handshake_message()))
 
@@ -50,7 +49,7 @@ class LongPollingTransport(BaseTransport):
                     raw = await r.read()
                     content = raw.decode()
                     if content:
-                        self.logger.debug(f"Received: {content}")
+                        self.wire_logger.log("Received", content)
                         await queue.put(content)
                 elif r.status == 204:
                     continue
@@ -79,7 +78,7 @@ class LongPollingTransport(BaseTransport):
         """
         Sends packets to the server
         """
-        self.logger.debug(f"Sent: {packet}")
+        self.wire_logger.log("Sent", packet)
         if self.conn and self.receive_task and not self.stop_event.is_set():
             await self.conn.post(self.url, params=dict(id=self.connection_id), data=packet)
         else:
@@ -90,5 +89,4 @@ class LongPollingTransport(BaseTransport):
         Stops Long Polling transport connection
         """
         self.stop_event.set()
-        if self.conn:
-            self.conn.close()
+        await self._close_client_session()
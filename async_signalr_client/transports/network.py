@@ -0,0 +1,165 @@
+import ssl
+import time
+import socket
+import typing
+import asyncio
+import weakref
+import aiohttp
+from urllib import parse
+from aiohttp.abc import AbstractResolver
+
+
+class ResumingSSLContext(ssl.SSLContext):
+    """
+    Client SSLContext that resumes TLS sessions
+    - Certificates are loaded once and shared by every connection using the context
+    - New connections to a host offer the session of the last connection to that host, so the server can skip the
+      full handshake (see SSLObject.session_reused)
+    """
+
+    def __new__(cls, protocol: int = ssl.PROTOCOL_TLS_CLIENT, *args, **kwargs):
+        return super().__new__(cls, protocol, *args, **kwargs)
+
+    def __init__(self, protocol: int = ssl.PROTOCOL_TLS_CLIENT):
+        super().__init__()
+        self._sessions: typing.Dict[str, ssl.SSLSession] = dict()
+        self._last: typing.Dict[str, weakref.ref] = dict()
+        self._live: "weakref.WeakSet[ssl.SSLObject]" = weakref.WeakSet()
+
+    @property
+    def resumed(self) -> int:
+        """
+        Number of open connections whose TLS session was resumed
+        """
+        return sum(1 for x in list(self._live) if x.session_reused)
+
+    def _session(self, server_hostname: str) -> typing.Optional[ssl.SSLSession]:
+        ref = self._last.get(server_hostname)
+        sslobj = ref() if ref is not None else None
+        if sslobj is not None and sslobj.session is not None:
+            self._sessions[server_hostname] = sslobj.session
+        return self._sessions.get(server_hostname)
+
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None, session=None):
+        if session is None and not server_side and server_hostname:
+            session = self._session(server_hostname)
+        sslobj = super().wrap_bio(incoming, outgoing, server_side=server_side, server_hostname=server_hostname,
+                                  session=session)
+        if server_hostname and not server_side:
+            self._last[server_hostname] = weakref.ref(sslobj)
+            self._live.add(sslobj)
+        return sslobj
+
+
+def create_ssl_context(cafile: typing.Optional[str] = None) -> ResumingSSLContext:
+    """
+    Creates a client SSLContext verifying certificates with the system CAs, or the given CA bundle
+    """
+    context = ResumingSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    if cafile:
+        context.load_verify_locations(cafile)
+    else:
+        context.load_default_certs()
+    return context
+
+
+class CachingResolver(AbstractResolver):
+    """
+    DNS resolver shared by connections
+    - Results are cached for ttl_s seconds
+    - Concurrent lookups of the same host share a single getaddrinfo call
+    """
+
+    def __init__(self, ttl_s: float = 300):
+        self.ttl_s = ttl_s
+        self._cache: typing.Dict[tuple, typing.Tuple[float, typing.List[dict]]] = dict()
+        self._pending: typing.Dict[tuple, asyncio.Future] = dict()
+        self.lookups = 0
+
+    async def _lookup(self, host: str, port: int, family: int) -> typing.List[dict]:
+        self.lookups += 1
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM, family=family)
+        return [dict(hostname=host, host=address[0], port=address[1], family=family_, proto=proto,
+                     flags=socket.AI_NUMERICHOST | socket.AI_NUMERICSERV)
+                for family_, _, proto, _, address in infos]
+
+    async def resolve(self, host: str, port: int = 0, family: int = socket.AF_INET) -> typing.List[dict]:
+        key = (host, port, family)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = asyncio.ensure_future(self._lookup(host, port, family))
+            try:
+                results = await pending
+            finally:
+                del self._pending[key]
+            self._cache[key] = (time.monotonic() + self.ttl_s, results)
+            return results
+        return await asyncio.shield(pending)
+
+    async def close(self):
+        self._cache.clear()
+
+
+class NetworkContext:
+    """
+    Network resources shared by many connections
+    - ssl_context: Certificates loaded once, TLS sessions resumed
+    - resolver: Cached DNS resolution
+    - session: aiohttp session whose keep-alive pool is reused by negotiate and HTTP transports
+    Note: The session is bound to the loop it is first used in
+    """
+
+    def __init__(self,
+                 ssl_context: typing.Optional[ssl.SSLContext] = None,
+                 resolver: typing.Optional[CachingResolver] = None,
+                 connection_limit: int = 0,
+                 keepalive_timeout_s: float = 60):
+        self.ssl_context = create_ssl_context() if ssl_context is None else ssl_context
+        self.resolver = CachingResolver() if resolver is None else resolver
+        self.connection_limit = connection_limit
+        self.keepalive_timeout_s = keepalive_timeout_s
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(resolver=self.resolver,
+                                             ssl=self.ssl_context,
+                                             limit=self.connection_limit,
+                                             keepalive_timeout=self.keepalive_timeout_s)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def resolve(self, url: str) -> typing.Tuple[str, int]:
+        """
+        Resolves the host of an url, returns the address and port to connect to
+        """
+        parsed_url = parse.urlparse(url)
+        port = parsed_url.port or (443 if parsed_url.scheme in ("https", "wss") else 80)
+        results = await self.resolver.resolve(parsed_url.hostname, port, socket.AF_UNSPEC)
+        return results[0]["host"], port
+
+    async def warm_up(self, urls: typing.Iterable[str]):
+        """
+        Pre-resolves the hosts of the given urls and opens a keep-alive connection to each of them
+        Note: This also performs the first full TLS handshake so later connections can resume the session
+        """
+        async def warm(url: str):
+            parsed_url = parse.urlparse(url)
+            scheme = "https" if parsed_url.scheme in ("https", "wss") else "http"
+            await self.resolve(url)
+            try:
+                async with self.session.head(parse.urlunparse((scheme, parsed_url.netloc, "/", "", "", ""))):
+                    pass
+            except aiohttp.ClientError:
+                pass
+
+        await asyncio.gather(*(warm(x) for x in set(urls)))
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,29 @@
+import typing
+from async_signalr_client.transports.base_transport import BaseTransport
+
+# Transports by the name used in the negotiate response, in order of preference
+_TRANSPORTS: typing.Dict[str, typing.Type[BaseTransport]] = dict()
+
+
+def register_transport(name: str, transport: typing.Type[BaseTransport]):
+    """
+    Registers a transport under the name the server advertises in availableTransports
+    """
+    _TRANSPORTS[name] = transport
+
+
+def get_transport(name: str) -> typing.Type[BaseTransport]:
+    """
+    Returns the transport registered for the given name
+    """
+    try:
+        return _TRANSPORTS[name]
+    except KeyError:
+        raise KeyError(f"Transport not registered: {name}")
+
+
+def registered_transports() -> typing.List[str]:
+    """
+    Returns the names of all registered transports in order of preference
+    """
+    return list(_TRANSPORTS)
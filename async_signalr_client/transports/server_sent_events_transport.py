@@ -0,0 +1,152 @@
+import typing
+import asyncio
+import aiohttp
+from async_signalr_client.protocols import BaseSignalRProtocol
+from async_signalr_client.exceptions import SignalRConnectionError
+from async_signalr_client.transports.base_transport import BaseTransport
+
+
+class ServerSentEventsParser:
+    """
+    Incremental text/event-stream parser
+    Chunks may split lines and events at any position, only the data field of each event is kept
+    Reference: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._data: typing.List[str] = []
+
+    def feed(self, chunk: bytes) -> typing.List[str]:
+        """
+        Consumes a chunk of the stream and returns the data of every event completed by it
+        """
+        self._buffer += chunk
+        end = self._buffer.rfind(b"\n")
+        if end == -1:
+            return []
+        lines = self._buffer[:end].decode().split("\n")
+        del self._buffer[:end + 1]
+
+        events = []
+        for line in lines:
+            if line.endswith("\r"):
+                line = line[:-1]
+            if not line:
+                # Blank line dispatches the event
+                if self._data:
+                    events.append("\n".join(self._data))
+                    self._data = []
+            elif line.startswith("data"):
+                field, _, value = line.partition(":")
+                if field == "data":
+                    self._data.append(value[1:] if value.startswith(" ") else value)
+            # Comments (":") and other fields (event, id, retry) are not used by SignalR
+        return events
+
+
+class ServerSentEventsTransport(BaseTransport):
+    """
+    Implements Server-Sent Events Transport
+    - Downstream messages are read from a single streaming GET request
+    - Upstream messages are sent with POST requests reusing the session keep-alive connections
+    Reference: https://github.com/aspnet/AspNetCore/blob/master/src/SignalR/docs/specs/TransportProtocols.md
+    """
+    SECURE_SCHEME = 'https'
+    UNSECURE_SCHEME = 'http'
+
+    def __init__(self, url, network=None):
+        super().__init__(url, 'ServerSentEvents', network)
+        self.last_connection_callback = None
+        self.response: typing.Optional[aiohttp.ClientResponse] = None
+
+    async def connect(self,
+                      protocol: BaseSignalRProtocol,
+                      queue: asyncio.Queue,
+                      on_online: typing.Optional[typing.Callable[[None], None]] = None,
+                      on_offline: typing.Optional[typing.Callable[[None], None]] = None):
+        """
+        Sets up the connection with the server, including the protocol negotiation
+        """
+        self.on_online = on_online
+        self.on_offline = on_offline
+        self.stop_event.clear()
+        if await self.validate_transport() is not True:
+            raise SignalRConnectionError(f"{self.transport_name} transport not available...")
+
+        if self.conn is None:
+            self.conn = self._client_session()
+        self.response = await self._open_stream()
+        loop = asyncio.get_running_loop()
+        self.receive_task = loop.create_task(self.receive(queue))
+        await self.send(protocol.encode(protocol.handshake_message()))
+
+    async def _open_stream(self) -> aiohttp.ClientResponse:
+        """
+        Opens the event stream, the request is not subject to the session timeouts as it stays open
+        """
+        response = await self.conn.get(self.url,
+                                       params=dict(id=self.connection_id),
+                                       headers={"Accept": "text/event-stream"},
+                                       timeout=aiohttp.ClientTimeout(total=None, sock_read=None))
+        if response.status != 200:
+            response.release()
+            raise SignalRConnectionError(f"Server returned unexpected status code: {response.status}")
+        self.connection_state = 1
+        self._check_connection()
+        return response
+
+    async def receive(self, queue: asyncio.Queue):
+        """
+        Parses the event stream as it arrives and adds each message to the given queue
+        """
+        parser = ServerSentEventsParser()
+        try:
+            async for chunk in self.response.content.iter_any():
+                for data in parser.feed(chunk):
+                    self.wire_logger.log("Received", data)
+                    await queue.put(data)
+                if self.stop_event.is_set():
+                    return
+        except aiohttp.ClientError as e:
+            raise SignalRConnectionError(e)
+        finally:
+            self.connection_state = 0
+            self._check_connection()
+        if not self.stop_event.is_set():
+            raise SignalRConnectionError("Event stream was closed by the server")
+
+    def _check_connection(self):
+        """
+        Triggers callbacks when connection state changes
+        """
+        if self.last_connection_callback != self.connection_state:
+            self.last_connection_callback = self.connection_state
+            if self.connection_state == 1:
+                if self.on_online:
+                    self.on_online()
+            else:
+                if self.on_offline:
+                    self.on_offline()
+
+    async def send(self, packet):
+        """
+        Sends packets to the server
+        """
+        self.wire_logger.log("Sent", packet)
+        if self.conn and self.receive_task and not self.stop_event.is_set():
+            # Releasing the response returns the connection to the keep-alive pool
+            async with self.conn.post(self.url, params=dict(id=self.connection_id), data=packet) as r:
+                if r.status != 200:
+                    raise SignalRConnectionError(f"Server returned unexpected status code: {r.status}")
+        else:
+            raise SignalRConnectionError("Unable to send packet as connection has not been established")
+
+    async def stop(self):
+        """
+        Stops Server-Sent Events transport connection
+        """
+        self.stop_event.set()
+        if self.response:
+            self.response.close()
+        await self._close_client_session()
@@ -0,0 +1,353 @@
+"""
+Shared-memory ring buffer used to fan out the records received by one connection to local subscriber processes
+- A single writer (see fanout.FanoutConnection) appends framed records, readers keep their own position
+- Readers that fall more than a ring behind are detected on both sides: the reader counts an overrun and skips
+  to the newest record, the writer sees its lag in the reader slots
+"""
+import os
+import sys
+import struct
+import typing
+import asyncio
+from urllib import parse
+from multiprocessing import shared_memory, resource_tracker
+from async_signalr_client.models import messages
+from async_signalr_client.protocols import BaseSignalRProtocol
+from async_signalr_client.exceptions import SignalRConnectionError
+from async_signalr_client.transports.base_transport import BaseTransport
+
+TEXT = 0
+BYTES = 1
+
+_MAGIC = b"SRRING01"
+_WRAP = 0xFFFFFFFF
+_HANDSHAKE_SIZE = 1024
+_HEADER_SIZE = 64
+_SLOT = struct.Struct("<QII")  # position, pid, active
+_RECORD = struct.Struct("<IB")  # length, kind
+_U64 = struct.Struct("<Q")
+
+# Header offsets
+_CAPACITY = 8
+_MAX_READERS = 16
+_HANDSHAKE_LENGTH = 20
+_HEAD = 24
+_RESERVE = 32
+_CLOSED = 40
+_HANDSHAKE_KIND = 41
+
+
+class SharedMemoryRing:
+    """
+    Single writer, multiple readers ring of length prefixed records stored in a named shared memory block
+    Note: Positions are absolute byte counts, the writer publishes `reserve` before writing and `head` after,
+      so readers can tell whether a record they copied was overwritten meanwhile
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.buf = shm.buf
+        if bytes(self.buf[:8]) != _MAGIC:
+            raise SignalRConnectionError(f"Shared memory {shm.name} is not a fan-out ring")
+        self.capacity = _U64.unpack_from(self.buf, _CAPACITY)[0]
+        self.max_readers = struct.unpack_from("<I", self.buf, _MAX_READERS)[0]
+        self.slots_offset = _HEADER_SIZE + _HANDSHAKE_SIZE
+        self.data_offset = self.slots_offset + self.max_readers * _SLOT.size
+        self._head = self.head
+
+    @classmethod
+    def create(cls, name: typing.Optional[str] = None, capacity: int = 2**24, max_readers: int = 16):
+        """
+        Creates the ring, the creator is the only process allowed to publish
+        """
+        size = _HEADER_SIZE + _HANDSHAKE_SIZE + max_readers * _SLOT.size + capacity
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        shm.buf[:_HEADER_SIZE + _HANDSHAKE_SIZE + max_readers * _SLOT.size] = \
+            bytes(_HEADER_SIZE + _HANDSHAKE_SIZE + max_readers * _SLOT.size)
+        _U64.pack_into(shm.buf, _CAPACITY, capacity)
+        struct.pack_into("<I", shm.buf, _MAX_READERS, max_readers)
+        shm.buf[:8] = _MAGIC
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str):
+        """
+        Attaches to a ring created by another process
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            # Before 3.13 attaching registers the block with the resource tracker, which unlinks it when the reader
+            # exits. Unregistering afterwards breaks the creator when both share the tracker (spawned children)
+            register, resource_tracker.register = resource_tracker.register, lambda *args, **kwargs: None
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        return cls(shm, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def head(self) -> int:
+        return _U64.unpack_from(self.buf, _HEAD)[0]
+
+    @property
+    def reserve(self) -> int:
+        return _U64.unpack_from(self.buf, _RESERVE)[0]
+
+    @property
+    def closed(self) -> bool:
+        return bool(self.buf[_CLOSED])
+
+    def publish(self, payload: bytes, kind: int = TEXT):
+        """
+        Appends a record to the ring
+        """
+        size = _RECORD.size + len(payload)
+        if size > self.capacity:
+            raise ValueError(f"Record of {len(payload)} bytes does not fit a ring of {self.capacity} bytes")
+        head = self._head
+        offset = head % self.capacity
+        remaining = self.capacity - offset
+        if remaining < size:
+            # Records never wrap, the tail of the ring is skipped instead
+            head += remaining
+            _U64.pack_into(self.buf, _RESERVE, head + size)
+            if remaining >= _RECORD.size:
+                _RECORD.pack_into(self.buf, self.data_offset + offset, _WRAP, 0)
+            offset = 0
+        else:
+            _U64.pack_into(self.buf, _RESERVE, head + size)
+        start = self.data_offset + offset
+        _RECORD.pack_into(self.buf, start, len(payload), kind)
+        self.buf[start + _RECORD.size:start + size] = payload
+        self._head = head + size
+        _U64.pack_into(self.buf, _HEAD, self._head)
+
+    def set_handshake(self, payload: bytes, kind: int = TEXT):
+        """
+        Stores the handshake response so readers attaching later can complete their own handshake
+        """
+        if len(payload) > _HANDSHAKE_SIZE:
+            raise ValueError(f"Handshake of {len(payload)} bytes is larger than {_HANDSHAKE_SIZE} bytes")
+        self.buf[_HEADER_SIZE:_HEADER_SIZE + len(payload)] = payload
+        self.buf[_HANDSHAKE_KIND] = kind
+        struct.pack_into("<I", self.buf, _HANDSHAKE_LENGTH, len(payload))
+
+    def handshake(self) -> typing.Optional[typing.Tuple[int, bytes]]:
+        length = struct.unpack_from("<I", self.buf, _HANDSHAKE_LENGTH)[0]
+        if not length:
+            return None
+        return self.buf[_HANDSHAKE_KIND], bytes(self.buf[_HEADER_SIZE:_HEADER_SIZE + length])
+
+    def readers(self) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Returns (pid, lag in bytes) for every attached reader
+        """
+        head = self.head
+        result = []
+        for i in range(self.max_readers):
+            position, pid, active = _SLOT.unpack_from(self.buf, self.slots_offset + i * _SLOT.size)
+            if active:
+                result.append((pid, max(head - position, 0)))
+        return result
+
+    def slow_readers(self, threshold: float = 0.5) -> typing.List[int]:
+        """
+        Returns the pids of the readers lagging behind more than `threshold` of the ring capacity
+        """
+        return [pid for pid, lag in self.readers() if lag > self.capacity * threshold]
+
+    def close(self, unlink: typing.Optional[bool] = None):
+        """
+        Releases the shared memory, the creator marks the ring closed and unlinks it by default
+        """
+        if self.buf is None:
+            return
+        if self.owner:
+            self.buf[_CLOSED] = 1
+        self.buf = None
+        self.shm.close()
+        if self.owner if unlink is None else unlink:
+            self.shm.unlink()
+
+
+class RingReader:
+    """
+    Reads the records published after it attached
+    - overruns: Number of times the writer lapped this reader
+    - dropped_bytes: Bytes skipped because of overruns
+    """
+
+    def __init__(self, ring: SharedMemoryRing):
+        self.ring = ring
+        self.position = ring.head
+        self.overruns = 0
+        self.dropped_bytes = 0
+        self.slot = self._claim_slot()
+
+    def _claim_slot(self) -> int:
+        buf, pid = self.ring.buf, os.getpid()
+        for i in range(self.ring.max_readers):
+            offset = self.ring.slots_offset + i * _SLOT.size
+            _, slot_pid, active = _SLOT.unpack_from(buf, offset)
+            if active and _alive(slot_pid):
+                continue
+            _SLOT.pack_into(buf, offset, self.position, pid, 1)
+            if _SLOT.unpack_from(buf, offset)[1] == pid:
+                return i
+        raise SignalRConnectionError(f"All {self.ring.max_readers} reader slots of {self.ring.name} are in use")
+
+    def _overrun(self, head: int):
+        self.overruns += 1
+        self.dropped_bytes += head - self.position
+        self.position = head
+
+    def read(self, max_records: int = 1024) -> typing.List[typing.Tuple[int, bytes]]:
+        """
+        Returns up to max_records (kind, payload) records
+        Note: Records are dropped and the reader skips to the newest record when the writer laps it
+        """
+        ring, buf = self.ring, self.ring.buf
+        capacity, data_offset = ring.capacity, ring.data_offset
+        head = ring.head
+        if head - self.position > capacity:
+            self._overrun(head)
+        position = self.position
+        records = []
+        while position < head and len(records) < max_records:
+            offset = position % capacity
+            remaining = capacity - offset
+            if remaining < _RECORD.size:
+                position += remaining
+                continue
+            length, kind = _RECORD.unpack_from(buf, data_offset + offset)
+            if length == _WRAP:
+                position += remaining
+                continue
+            if length > remaining - _RECORD.size:
+                break  # Overwritten while reading, detected below
+            start = data_offset + offset + _RECORD.size
+            records.append((kind, bytes(buf[start:start + length])))
+            position += _RECORD.size + length
+        # Anything before reserve - capacity may have been overwritten while it was copied
+        if ring.reserve - self.position > capacity:
+            self._overrun(ring.head)
+            return []
+        self.position = position
+        _U64.pack_into(buf, ring.slots_offset + self.slot * _SLOT.size, position)
+        return records
+
+    def close(self):
+        if self.ring.buf is not None:
+            _SLOT.pack_into(self.ring.buf, self.ring.slots_offset + self.slot * _SLOT.size, 0, 0, 0)
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class SharedMemoryTransport(BaseTransport):
+    """
+    Receive-only transport reading the records a FanoutConnection publishes in a shared-memory ring
+    - url: Name of the ring, optionally as shm://<name>
+    - poll_interval_s: Initial wait when the ring is empty, doubled while idle up to max_poll_interval_s
+    Note: Pings are dropped, any other send raises SignalRConnectionError as the socket belongs to the publisher
+    """
+
+    def __init__(self, url: str, poll_interval_s: float = 0.0005, max_poll_interval_s: float = 0.02,
+                 batch_size: int = 1024):
+        super().__init__(url, 'SharedMemory')
+        parsed_url = parse.urlparse(url)
+        self.ring_name = (parsed_url.netloc or parsed_url.path) if parsed_url.scheme == "shm" else url
+        self.poll_interval_s = poll_interval_s
+        self.max_poll_interval_s = max_poll_interval_s
+        self.batch_size = batch_size
+        self.ring: typing.Optional[SharedMemoryRing] = None
+        self.reader: typing.Optional[RingReader] = None
+        self._separator = ""
+        self._ping = None
+
+    def normalize_url_scheme(self, url: str):
+        return url
+
+    async def connect(self,
+                      protocol: BaseSignalRProtocol,
+                      queue: asyncio.Queue,
+                      on_online: typing.Optional[typing.Callable[[None], None]] = None,
+                      on_offline: typing.Optional[typing.Callable[[None], None]] = None):
+        self.on_online = on_online
+        self.on_offline = on_offline
+        self._separator = protocol.separator
+        self._ping = protocol.encode(messages.PingMessage())
+        try:
+            self.ring = SharedMemoryRing.attach(self.ring_name)
+        except FileNotFoundError:
+            raise SignalRConnectionError(f"Fan-out ring {self.ring_name} does not exist")
+        self.reader = RingReader(self.ring)
+        self.receive_task = asyncio.get_running_loop().create_task(self.receive(queue))
+        if self.on_online is not None:
+            self.on_online()
+
+    def _frame(self, kind: int, payload: bytes):
+        return payload.decode() + self._separator if kind == TEXT else payload
+
+    async def receive(self, queue: asyncio.Queue):
+        delay = self.poll_interval_s
+        handshake = None
+        overruns = 0
+        try:
+            while not self.stop_event.is_set():
+                if handshake is None:
+                    # The publisher stores the handshake response once its own connection is established
+                    handshake = self.ring.handshake()
+                    if handshake is not None:
+                        queue.put_nowait(self._frame(*handshake))
+                records = self.reader.read(self.batch_size) if handshake is not None else []
+                if records:
+                    delay = self.poll_interval_s
+                    for kind, payload in records:
+                        self.wire_logger.log("Received", payload)
+                        queue.put_nowait(self._frame(kind, payload))
+                    await asyncio.sleep(0)
+                elif self.ring.closed:
+                    self.logger.info("Fan-out ring %s closed by the publisher", self.ring_name)
+                    break
+                else:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.max_poll_interval_s)
+                if self.reader.overruns != overruns:
+                    overruns = self.reader.overruns
+                    self.logger.warning("Reader lapped by the publisher of %s: %d overruns, %d bytes dropped",
+                                        self.ring_name, overruns, self.reader.dropped_bytes)
+        finally:
+            if self.on_offline is not None:
+                self.on_offline()
+
+    async def send(self, packet):
+        if packet == self._ping:
+            return
+        raise SignalRConnectionError("Fan-out subscribers are receive-only, invoke from the publishing connection")
+
+    async def stop(self):
+        self.stop_event.set()
+        if self.receive_task is not None and not self.receive_task.done():
+            self.receive_task.cancel()
+            try:
+                await self.receive_task
+            except asyncio.CancelledError:
+                pass
+        if self.reader is not None:
+            self.reader.close()
+        if self.ring is not None:
+            self.ring.close()
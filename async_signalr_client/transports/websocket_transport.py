@@ -1,9 +1,11 @@
 import typing
 import asyncio
 import websockets
+from urllib import parse
 from async_signalr_client.protocols import BaseSignalRProtocol
 from async_signalr_client.exceptions import SignalRConnectionError
 from async_signalr_client.transports.base_transport import BaseTransport
+from async_signalr_client.transports.compression import deflate_factory
 
 
 class WebSocketTransport(BaseTransport):
@@ -14,8 +16,42 @@ class WebSocketTransport(BaseTransport):
     SECURE_SCHEME = 'wss'
     UNSECURE_SCHEME = 'ws'
 
-    def __init__(self, url):
-        super().__init__(url, 'WebSockets')
+    def __init__(self,
+                 url: str,
+                 compression: bool = True,
+                 compression_threshold: int = 0,
+                 compression_level: typing.Optional[int] = None,
+                 memory_level: typing.Optional[int] = None,
+                 client_max_window_bits: typing.Optional[int] = None,
+                 server_max_window_bits: typing.Optional[int] = None,
+                 max_size: typing.Optional[int] = 2 ** 20,
+                 max_queue: typing.Optional[int] = 2 ** 5,
+                 read_limit: int = 2 ** 16,
+                 write_limit: int = 2 ** 16,
+                 network=None):
+        """
+        - compression: Negotiate permessage-deflate with the server
+        - compression_threshold: Messages smaller than this number of bytes are sent uncompressed
+        - compression_level: zlib compression level (0-9), lower values trade bandwidth for CPU
+        - memory_level: zlib memory level (1-9) of the compressor
+        - client_max_window_bits/server_max_window_bits: Deflate window (8-15) of each direction
+        - max_size: Maximum size of incoming messages in bytes (None disables the limit)
+        - max_queue: Maximum number of incoming messages buffered by the websocket
+        - read_limit/write_limit: High-water marks of the read and write buffers in bytes
+        - network: Shared SSL context (with TLS session resumption), DNS cache and keep-alive pool
+        """
+        super().__init__(url, 'WebSockets', network)
+        self.connect_options = dict(max_size=max_size,
+                                    max_queue=max_queue,
+                                    read_limit=read_limit,
+                                    write_limit=write_limit,
+                                    compression=None)
+        if compression:
+            self.connect_options["extensions"] = [deflate_factory(client_max_window_bits=client_max_window_bits,
+                                                                  server_max_window_bits=server_max_window_bits,
+                                                                  memory_level=memory_level,
+                                                                  compression_level=compression_level,
+                                                                  threshold=compression_threshold)]
 
     async def connect(self,
                       protocol: BaseSignalRProtocol,
@@ -31,11 +67,24 @@ class WebSocketTransport(BaseTransport):
         if await self.validate_transport() is not True:
             raise SignalRConnectionError(f"{self.transport_name} transport not available...")
         if not self.conn:
-            self.conn: websockets.WebSocketClientProtocol = await websockets.connect(self.url)
-        loop = asyncio.get_event_loop()
+            options = self.connect_options
+            if self.network is not None:
+                options = dict(options, **await self._network_options())
+            self.conn: websockets.WebSocketClientProtocol = await websockets.connect(self.url, **options)
+        loop = asyncio.get_running_loop()
         self.receive_task = loop.create_task(self.receive(queue))
         await self.send(protocol.encode(protocol.handshake_message()))
 
+    async def _network_options(self) -> dict:
+        """
+        Connects to the pre-resolved address, verifying TLS against the url host with the shared SSL context
+        """
+        host, port = await self.network.resolve(self.url)
+        options = dict(host=host, port=port)
+        if parse.urlparse(self.url).scheme == self.SECURE_SCHEME:
+            options.update(ssl=self.network.ssl_context, server_hostname=parse.urlparse(self.url).hostname)
+        return options
+
     async def receive(self, queue: asyncio.Queue):
         """
         Received packets from the websocket server and adds the to the given queue
@@ -44,7 +93,7 @@ class WebSocketTransport(BaseTransport):
             try:
                 self._check_connection()
                 data = await asyncio.wait_for(self.conn.recv(), 0.1)
-                self.logger.debug(f"Received: {data}")
+                self.wire_logger.log("Received", data)
                 if data:
                     await queue.put(data)
             except asyncio.TimeoutError:
@@ -71,7 +120,7 @@ class WebSocketTransport(BaseTransport):
         """
         Sends packets to the websocket server
         """
-        self.logger.debug(f"Sent: {packet}")
+        self.wire_logger.log("Sent", packet)
         if self.conn and self.receive_task and not self.stop_event.is_set():
             try:
                 self._check_connection()
@@ -0,0 +1,36 @@
+"""
+In-memory stand-in for a SignalR server used by the benchmarks
+"""
+import json
+from async_signalr_client.transports import BaseTransport
+
+SEPARATOR = chr(0x1E)
+
+
+class LoopbackTransport(BaseTransport):
+    """
+    Completes the handshake immediately and answers every invocation with a completion echoing its first argument
+    """
+
+    def __init__(self, url, **kwargs):
+        super().__init__(url, 'Loopback')
+        self.queue = None
+        self.sent = 0
+
+    async def connect(self, protocol, queue, on_online=None, on_offline=None):
+        self.queue = queue
+        self.receive_task = True
+        queue.put_nowait("{}" + SEPARATOR)
+
+    def push(self, payload: str):
+        self.queue.put_nowait(payload)
+
+    async def send(self, packet):
+        self.sent += 1
+        message = json.loads(packet.rstrip(SEPARATOR))
+        if message.get("type") == 1 and message.get("invocationId"):
+            completion = {"type": 3, "invocationId": message["invocationId"], "result": message["arguments"][0]}
+            self.queue.put_nowait(json.dumps(completion) + SEPARATOR)
+
+    async def stop(self):
+        self.stop_event.set()
@@ -0,0 +1,85 @@
+"""
+Compares compiled typed codecs against handlers converting raw dicts into domain objects by hand
+
+Usage: python benchmarks/bench_codecs.py [messages]
+"""
+import sys
+import json
+import time
+import typing
+import dataclasses
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from async_signalr_client.codecs import TypedArgumentCodec, camel_case  # noqa: E402
+
+
+@dataclasses.dataclass
+class Level:
+    price: float
+    size: int
+
+
+@dataclasses.dataclass
+class Book:
+    symbol: str
+    sequence_id: int
+    bids: typing.List[Level]
+    asks: typing.List[Level]
+
+
+def build_arguments(levels: int) -> list:
+    side = [{"price": 100.0 + i, "size": i + 1} for i in range(levels)]
+    return json.loads(json.dumps([{"symbol": "ABC", "sequenceId": 1, "bids": side, "asks": side}]))
+
+
+def by_hand(arguments):
+    raw = arguments[0]
+    return [Book(symbol=raw["symbol"],
+                 sequence_id=raw["sequenceId"],
+                 bids=[Level(float(x["price"]), x["size"]) for x in raw["bids"]],
+                 asks=[Level(float(x["price"]), x["size"]) for x in raw["asks"]])]
+
+
+def reflective(arguments):
+    """
+    Generic conversion resolving fields at runtime for every message
+    """
+    def convert(tp, value):
+        if dataclasses.is_dataclass(tp):
+            hints = typing.get_type_hints(tp)
+            return tp(**{f.name: convert(hints[f.name], value[camel_case(f.name)]) for f in dataclasses.fields(tp)})
+        if typing.get_origin(tp) is list:
+            return [convert(typing.get_args(tp)[0], x) for x in value]
+        return tp(value)
+    return [convert(Book, arguments[0])]
+
+
+def measure(function, arguments, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        function(arguments)
+    return count / (time.perf_counter() - start)
+
+
+def main(count: int = 20000):
+    codec = TypedArgumentCodec(Book, field_name=camel_case)
+    print(f"{'levels':>8}{'dict msg/s':>14}{'by hand':>14}{'reflective':>14}{'compiled':>14}")
+    for levels in (1, 10, 100):
+        arguments = build_arguments(levels)
+        assert codec.decode(arguments) == by_hand(arguments) == reflective(arguments)
+        n = max(count // levels, 100)
+        raw = measure(lambda x: x, arguments, n)
+        hand = measure(by_hand, arguments, n)
+        reflect = measure(reflective, arguments, n // 10)
+        compiled = measure(codec.decode, arguments, n)
+        print(f"{levels:>8}{raw:>14,.0f}{hand:>14,.0f}{reflect:>14,.0f}{compiled:>14,.0f}")
+    book = by_hand(build_arguments(10))
+    encode = measure(codec.encode, book, count)
+    asdict = measure(lambda x: [dataclasses.asdict(x[0])], book, count)
+    print(f"encode 10 levels: compiled {encode:,.0f} msg/s, dataclasses.asdict {asdict:,.0f} msg/s")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
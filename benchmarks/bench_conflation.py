@@ -0,0 +1,58 @@
+"""
+Measures how long a slow tick handler needs to catch up with a burst, with and without conflation
+The server is replaced by an in-memory loopback transport pushing `messages` ticks over `symbols` instruments
+
+Usage: python benchmarks/bench_conflation.py [messages] [symbols] [handler_us]
+"""
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _loopback import LoopbackTransport, SEPARATOR  # noqa: E402
+from async_signalr_client import Connection, protocols  # noqa: E402
+
+
+async def scenario(count: int, symbols: int, handler_s: float, conflate: bool):
+    connection = Connection("ws://127.0.0.1:5000/chat", transport=LoopbackTransport, log_level=logging.CRITICAL,
+                            protocol=protocols.JsonProtocol(lazy_arguments=True))
+    latest = dict()
+    calls = 0
+
+    async def on_tick(symbol, sequence):
+        nonlocal calls
+        calls += 1
+        deadline = time.perf_counter() + handler_s
+        while time.perf_counter() < deadline:
+            pass
+        latest[symbol] = sequence
+        await asyncio.sleep(0)
+
+    connection.on("tick", on_tick)
+    conflator = connection.register_conflation("tick", key=0) if conflate else None
+    await connection.start()
+    start = time.perf_counter()
+    for i in range(count):
+        connection.transport.push(f'{{"type": 1, "target": "tick", "arguments": ["S{i % symbols}", {i}]}}{SEPARATOR}')
+    final = {f"S{i % symbols}": i for i in range(count - symbols, count)}
+    while latest != final:
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    await connection.stop()
+    return elapsed, calls, conflator.merged if conflator else 0
+
+
+def main(count: int = 20000, symbols: int = 20, handler_us: int = 200):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    print(f"{count} ticks over {symbols} symbols, handler {handler_us}us")
+    for name, conflate in [("every message", False), ("conflated", True)]:
+        elapsed, calls, merged = asyncio.run(scenario(count, symbols, handler_us / 1e6, conflate))
+        print(f"{name:<16}up to date after {elapsed:.2f}s, {calls} handler calls, {merged} merged")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
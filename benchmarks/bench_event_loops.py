@@ -0,0 +1,76 @@
+"""
+Compares the default asyncio event loop with uvloop on receive throughput and invoke latency
+The server is replaced by an in-memory loopback transport so only client overhead is measured
+
+Usage: python benchmarks/bench_event_loops.py [messages]
+"""
+import sys
+import time
+import asyncio
+import logging
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _loopback import LoopbackTransport, SEPARATOR  # noqa: E402
+from async_signalr_client import Connection, runtime  # noqa: E402
+
+PAYLOAD = '{"type": 1, "target": "tick", "arguments": ["ABC", 101.25, 3]}' + SEPARATOR
+
+
+async def receive_throughput(connection: Connection, count: int) -> float:
+    done = asyncio.Event()
+    received = 0
+
+    async def on_tick(*args):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    connection.on("tick", on_tick)
+    start = time.perf_counter()
+    for _ in range(count):
+        connection.transport.push(PAYLOAD)
+    await done.wait()
+    return count / (time.perf_counter() - start)
+
+
+async def invoke_latency(connection: Connection, count: int):
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        completion = await connection.invoke("Echo", i)
+        await completion
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return statistics.median(latencies) * 1e6, latencies[int(len(latencies) * 0.99)] * 1e6
+
+
+async def scenario(count: int):
+    # Built before the loop is running, connections only bind to the loop when started
+    connection = Connection("ws://127.0.0.1:5000/chat", transport=LoopbackTransport, log_level=logging.CRITICAL)
+    await connection.start()
+    throughput = await receive_throughput(connection, count)
+    p50, p99 = await invoke_latency(connection, count // 10)
+    await connection.stop()
+    return throughput, p50, p99
+
+
+def main(count: int = 20000):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    loops = [("asyncio", False)]
+    if runtime.uvloop_available():
+        loops.append(("uvloop", True))
+    else:
+        print("uvloop is not installed, only asyncio is measured")
+    print(f"{'loop':<10}{'receive msg/s':>16}{'invoke p50 us':>16}{'invoke p99 us':>16}")
+    for name, use_uvloop in loops:
+        throughput, p50, p99 = runtime.run(scenario(count), use_uvloop=use_uvloop)
+        print(f"{name:<10}{throughput:>16,.0f}{p50:>16.1f}{p99:>16.1f}")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,121 @@
+"""
+Compares N processes each owning a connection with one FanoutConnection publishing to N subscriber processes
+The server is replaced by an in-memory loopback transport, so the server load saved (N sockets -> 1) is not shown,
+only the CPU spent by the client processes
+
+Usage: python benchmarks/bench_fanout.py [processes] [messages]
+"""
+import sys
+import time
+import asyncio
+import logging
+import resource
+import multiprocessing
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _loopback import LoopbackTransport, SEPARATOR  # noqa: E402
+from async_signalr_client import Connection  # noqa: E402
+from async_signalr_client.fanout import FanoutConnection  # noqa: E402
+from async_signalr_client.transports import SharedMemoryTransport  # noqa: E402
+
+PAYLOAD = '{"type": 1, "target": "tick", "arguments": ["ABC", 101.25, 3]}' + SEPARATOR
+
+
+def cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+async def consume(connection: Connection, count: int, push: bool, ready=None):
+    done = asyncio.Event()
+    received = 0
+
+    async def on_tick(*args):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    connection.on("tick", on_tick)
+    await connection.start()
+    if ready is not None:
+        ready.set()
+    if push:
+        for _ in range(count):
+            connection.transport.push(PAYLOAD)
+    await done.wait()
+    await connection.stop()
+    await connection.transport.stop()
+    connection.keep_alive_task.cancel()
+
+
+def own_connection(count: int, results):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    connection = Connection("ws://127.0.0.1:5000/chat", transport=LoopbackTransport, log_level=logging.CRITICAL)
+    asyncio.run(consume(connection, count, push=True))
+    results.put(cpu_time())
+
+
+def subscriber(ring_name: str, count: int, ready, results):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    connection = Connection(ring_name, transport=SharedMemoryTransport, log_level=logging.CRITICAL)
+    asyncio.run(consume(connection, count, push=False, ready=ready))
+    results.put(cpu_time())
+
+
+async def publish(processes: int, count: int, results) -> float:
+    publisher = FanoutConnection("ws://127.0.0.1:5000/chat", transport=LoopbackTransport, dispatch_locally=False,
+                                 log_level=logging.CRITICAL, ring_capacity=2**26)
+    await publisher.start()
+    context = multiprocessing.get_context("spawn")
+    readies = [context.Event() for _ in range(processes)]
+    workers = [context.Process(target=subscriber, args=(publisher.ring_name, count, ready, results))
+               for ready in readies]
+    for worker in workers:
+        worker.start()
+    for ready in readies:
+        while not ready.is_set():
+            await asyncio.sleep(0.01)
+    start, cpu = time.perf_counter(), cpu_time()
+    for i in range(count):
+        publisher.transport.push(PAYLOAD)
+        if i % 1000 == 0:
+            await asyncio.sleep(0)
+    while not publisher.event_queue.empty():
+        await asyncio.sleep(0.001)
+    publisher_cpu = cpu_time() - cpu
+    while any(x.is_alive() for x in workers):
+        await asyncio.sleep(0.001)
+    wall = time.perf_counter() - start
+    await publisher.stop()
+    publisher.keep_alive_task.cancel()
+    return wall, publisher_cpu
+
+
+def main(processes: int = 4, count: int = 50000):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+
+    start = time.perf_counter()
+    workers = [context.Process(target=own_connection, args=(count, results)) for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - start
+    cpu = sum(results.get() for _ in workers)
+    print(f"{'own connection':<16}{processes} processes x {count} messages: wall {wall:.2f}s, "
+          f"cpu {cpu:.2f}s (includes interpreter start-up)")
+
+    wall, publisher_cpu = asyncio.run(publish(processes, count, results))
+    cpu = sum(results.get() for _ in range(processes)) + publisher_cpu
+    print(f"{'fan-out':<16}{processes} processes x {count} messages: wall {wall:.2f}s, "
+          f"cpu {cpu:.2f}s (includes interpreter start-up, publisher cpu {publisher_cpu:.2f}s)")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,69 @@
+"""
+Compares eager and lazy argument decoding on a broadcast stream where most targets have no handler
+
+Usage: python benchmarks/bench_lazy_arguments.py [messages] [handled_ratio]
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from async_signalr_client import Connection, SignalRConnectionState, protocols  # noqa: E402
+
+
+def build_stream(count: int, handled_ratio: float):
+    """
+    Builds a stream of invocations where handled_ratio of them target a subscribed event
+    Unhandled broadcasts carry larger argument payloads (order books, snapshots...)
+    """
+    rng = random.Random(1)
+    handled_targets = ["trade", "status"]
+    unhandled_targets = ["orderBook", "snapshot", "heartbeatDetail", "marketStats"]
+    stream = []
+    for i in range(count):
+        if rng.random() < handled_ratio:
+            target = rng.choice(handled_targets)
+            arguments = [{"id": i, "price": rng.random() * 100, "size": rng.randrange(1, 1000)}]
+        else:
+            target = rng.choice(unhandled_targets)
+            levels = [[rng.random() * 100, rng.randrange(1, 1000)] for _ in range(rng.randrange(20, 200))]
+            arguments = [{"symbol": "ABC", "bids": levels, "asks": levels}, i]
+        stream.append(json.dumps({"type": 1, "target": target, "arguments": arguments}))
+    return stream, handled_targets
+
+
+async def run(protocol, stream, handled_targets) -> float:
+    conn = Connection("ws://127.0.0.1:5000/chat", protocol=protocol, log_level=logging.CRITICAL)
+    conn._state = SignalRConnectionState.ONLINE
+
+    async def handler(*args):
+        pass
+
+    for target in handled_targets:
+        conn.on(target, handler)
+    start = time.perf_counter()
+    for packet in stream:
+        await conn._execute(packet)
+    await asyncio.sleep(0)
+    return len(stream) / (time.perf_counter() - start)
+
+
+def main(count: int = 20000, handled_ratio: float = 0.1):
+    # Unhandled broadcasts are logged as warnings, silence them so only decoding is measured
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    stream, handled_targets = build_stream(count, handled_ratio)
+    size = sum(len(x) for x in stream) / len(stream)
+    print(f"{count} messages, {handled_ratio:.0%} handled, {size:,.0f} bytes average")
+    eager = asyncio.run(run(protocols.JsonProtocol(), stream, handled_targets))
+    lazy = asyncio.run(run(protocols.JsonProtocol(lazy_arguments=True), stream, handled_targets))
+    print(f"{'eager':<10}{eager:>12,.0f} msg/s")
+    print(f"{'lazy':<10}{lazy:>12,.0f} msg/s{lazy / eager:>10.2f}x")
+
+
+if __name__ == '__main__':
+    main(*[float(x) if "." in x else int(x) for x in sys.argv[1:]])
@@ -0,0 +1,80 @@
+"""
+Measures inbound dispatch throughput with the lazy logging layer against the previous eager f-string logging
+
+Usage: python benchmarks/bench_logging.py [messages]
+"""
+import sys
+import time
+import asyncio
+import logging
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from async_signalr_client import Connection, SignalRConnectionState  # noqa: E402
+from async_signalr_client.models import messages  # noqa: E402
+
+PAYLOAD = ('{"type": 1, "target": "tick", "arguments": [{"symbol": "ABC", "bid": 101.25, "ask": 101.5, '
+           '"levels": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]}]}')
+
+
+class EagerLoggingConnection(Connection):
+    """
+    Reproduces the previous behaviour: payloads are formatted with f-strings whether or not the level is enabled
+    """
+
+    async def _execute(self, packet: str):
+        message = self.protocol.parse(packet)
+        if message.type is messages.SignalRMessageType.INVOCATION:
+            self.logger.info(f"INVOKE: {message}")
+            await self._call_handlers(message)
+
+    def wire(self, payload):
+        self.transport.logger.debug(f"Received: {payload}")
+
+
+class LazyLoggingConnection(Connection):
+
+    def wire(self, payload):
+        self.transport.wire_logger.log("Received", payload)
+
+
+async def noop(*args):
+    pass
+
+
+async def run(connection_class, count: int, **kwargs) -> float:
+    conn = connection_class("ws://127.0.0.1:5000/chat", **kwargs)
+    conn._state = SignalRConnectionState.ONLINE
+    conn.on("tick", noop)
+    start = time.perf_counter()
+    for _ in range(count):
+        conn.wire(PAYLOAD)
+        await conn._execute(PAYLOAD)
+    await asyncio.sleep(0)
+    return count / (time.perf_counter() - start)
+
+
+def main(count: int = 50000):
+    library_logger = logging.getLogger("AsyncSignalRClient")
+    transport_logger = logging.getLogger("AsyncSignalRClient-WebSocketsTransport")
+    null_handler = logging.NullHandler()
+    transport_logger.addHandler(null_handler)
+    transport_logger.propagate = False
+    scenarios = [
+        ("logging disabled", logging.WARNING, {}),
+        ("wire debug enabled", logging.DEBUG, {}),
+        ("wire debug, 1/100 sampled, 128 chars", logging.DEBUG, dict(wire_log_sample_every=100,
+                                                                     wire_log_max_length=128)),
+    ]
+    print(f"{'scenario':<40}{'eager msg/s':>15}{'lazy msg/s':>15}{'speedup':>10}")
+    for name, level, kwargs in scenarios:
+        library_logger.setLevel(logging.WARNING)
+        transport_logger.setLevel(level)
+        eager = asyncio.run(run(EagerLoggingConnection, count, log_level=logging.CRITICAL))
+        lazy = asyncio.run(run(LazyLoggingConnection, count, log_level=logging.CRITICAL, **kwargs))
+        print(f"{name:<40}{eager:>15,.0f}{lazy:>15,.0f}{lazy / eager:>9.2f}x")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
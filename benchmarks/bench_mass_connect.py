@@ -0,0 +1,100 @@
+"""
+Measures wall and CPU time to start many connections at once against a local TLS SignalR stand-in
+- default: every connection negotiates with its own session, loads certificates and performs a full TLS handshake
+- network context: shared SSL context with session resumption, cached DNS, pooled negotiate and warm_up()
+
+Usage: python benchmarks/bench_mass_connect.py [connections]
+"""
+import os
+import ssl
+import sys
+import time
+import asyncio
+import logging
+import tempfile
+import subprocess
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SEPARATOR = chr(0x1E)
+
+
+def create_certificate(directory: str):
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", cert,
+                    "-days", "1", "-subj", "/CN=localhost", "-addext", "subjectAltName=DNS:localhost"],
+                   check=True, capture_output=True)
+    return cert, key
+
+
+async def start_server(cert: str, key: str):
+    from aiohttp import web
+    counter = 0
+
+    async def negotiate(request):
+        nonlocal counter
+        counter += 1
+        return web.json_response({"connectionId": str(counter),
+                                  "availableTransports": [{"transport": "WebSockets"}]})
+
+    async def hub(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for _ in ws:
+            # Answer the handshake request, then keep the connection idle
+            await ws.send_str("{}" + SEPARATOR)
+        return ws
+
+    app = web.Application()
+    app.router.add_post("/chat/negotiate", negotiate)
+    app.router.add_get("/chat", hub)
+    app.router.add_route("HEAD", "/", lambda request: web.Response())
+    runner = web.AppRunner(app)
+    await runner.setup()
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    await web.TCPSite(runner, "localhost", 5443, ssl_context=context, backlog=4096).start()
+    return runner
+
+
+async def mass_connect(count: int, network=None):
+    from async_signalr_client import Connection
+    url = "wss://localhost:5443/chat"
+    options = dict(network=network) if network else None
+    connections = [Connection(url, transport_options=options, log_level=logging.CRITICAL) for _ in range(count)]
+    wall, cpu = time.perf_counter(), time.process_time()
+    if network:
+        await network.warm_up([url])
+    await asyncio.gather(*(x.start() for x in connections))
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    resumed = network.ssl_context.resumed if network else 0
+    for connection in connections:
+        await connection.stop()
+        connection.transport.receive_task.cancel()
+        await connection.transport.conn.close()
+    return wall, cpu, resumed
+
+
+async def main(count: int = 200):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = create_certificate(directory)
+        # Lets the default SSL contexts trust the stand-in certificate, aiohttp builds them when imported
+        os.environ["SSL_CERT_FILE"] = cert
+        from async_signalr_client.transports import NetworkContext, create_ssl_context
+        runner = await start_server(cert, key)
+        try:
+            wall, cpu, _ = await mass_connect(count)
+            print(f"{'default':<18}{count} connections: wall {wall:.2f}s, cpu {cpu:.2f}s")
+            network = NetworkContext(ssl_context=create_ssl_context(cafile=cert))
+            wall, cpu, resumed = await mass_connect(count, network)
+            print(f"{'network context':<18}{count} connections: wall {wall:.2f}s, cpu {cpu:.2f}s "
+                  f"(dns lookups: {network.resolver.lookups}, tls sessions resumed: {resumed})")
+            await network.close()
+        finally:
+            await runner.cleanup()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(*[int(x) for x in sys.argv[1:]]))
@@ -0,0 +1,67 @@
+"""
+Replays a wire recording through Connection.process and the JSON protocol as fast as possible
+Without a recording argument a synthetic one is captured first from the in-memory loopback transport
+
+Usage: python benchmarks/bench_replay.py [recording] [rounds]
+"""
+import os
+import sys
+import time
+import asyncio
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _loopback import LoopbackTransport, SEPARATOR  # noqa: E402
+from async_signalr_client import Connection, protocols  # noqa: E402
+from async_signalr_client.recording import WireRecorder, read_recording, replay  # noqa: E402
+
+
+async def capture(path: str, count: int = 50000):
+    with WireRecorder(path) as recorder:
+        connection = Connection("ws://127.0.0.1:5000/chat", transport=LoopbackTransport, recorder=recorder)
+        await connection.start()
+        for i in range(count):
+            connection.transport.push(
+                f'{{"type": 1, "target": "tick", "arguments": ["ABC", {100 + i % 50 / 4}, {i}]}}{SEPARATOR}')
+        while not connection.event_queue.empty():
+            await asyncio.sleep(0)
+        await connection.stop()
+
+
+async def replay_once(path: str, protocol: protocols.BaseSignalRProtocol) -> float:
+    connection = Connection("ws://127.0.0.1:5000/chat", protocol=protocol)
+    connection.on("tick", noop)
+    start = time.perf_counter()
+    await replay(connection, path)
+    return time.perf_counter() - start
+
+
+async def noop(*args):
+    pass
+
+
+async def scenario(path: str, rounds: int):
+    frames = sum(1 for _ in read_recording(path))
+    print(f"{frames} frames, {os.path.getsize(path) / 1024:.0f} KiB")
+    for name, protocol in [("json", protocols.JsonProtocol()), ("json lazy", protocols.JsonProtocol(True))]:
+        best = min([await replay_once(path, protocol) for _ in range(rounds)])
+        print(f"{name:<12}{frames / best:>12,.0f} frames/s")
+
+
+def main(path: str = None, rounds: str = "3"):
+    logging.getLogger("AsyncSignalRClient").setLevel(logging.CRITICAL)
+    if path is None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "loopback.rec")
+            asyncio.run(capture(path))
+            asyncio.run(scenario(path, int(rounds)))
+    else:
+        asyncio.run(scenario(path, int(rounds)))
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -0,0 +1,83 @@
+"""
+Reports bytes on the wire against CPU per message for several permessage-deflate settings and payload shapes
+Frames are run through the same extension the WebSocketTransport negotiates, no server is required
+
+Usage: python benchmarks/bench_websocket_compression.py [messages]
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from websockets.frames import Frame, Opcode  # noqa: E402
+from websockets.extensions.permessage_deflate import PerMessageDeflate  # noqa: E402
+from async_signalr_client.protocols import JsonProtocol  # noqa: E402
+from async_signalr_client.transports.compression import ThresholdPerMessageDeflate  # noqa: E402
+
+SETTINGS = [
+    # name, enabled, compress_settings, window bits, threshold
+    ("off", False, {}, 15, 0),
+    ("default (memLevel 5)", True, {"memLevel": 5}, 15, 0),
+    ("level 1", True, {"memLevel": 5, "level": 1}, 15, 0),
+    ("level 9, memLevel 9", True, {"memLevel": 9, "level": 9}, 15, 0),
+    ("window 10, memLevel 1", True, {"memLevel": 1}, 10, 0),
+    ("default, threshold 256", True, {"memLevel": 5}, 15, 256),
+]
+
+
+def payloads(count: int):
+    rng = random.Random(1)
+    protocol = JsonProtocol()
+
+    def invocation(target, *arguments):
+        return protocol.encode({"type": 1, "target": target, "arguments": list(arguments)}).encode()
+
+    def book():
+        return {"symbol": "ABC", "bids": [[100 + rng.random(), rng.randrange(1000)] for _ in range(50)]}
+
+    return {
+        "ping": [protocol.encode({"type": 6}).encode()] * count,
+        "small invoke": [invocation("SendTick", "ABC", rng.random()) for _ in range(count)],
+        "order book": [invocation("book", book()) for _ in range(count)],
+        "numeric series": [invocation("series", [rng.random() for _ in range(5000)]) for _ in range(count // 10)],
+        "random text": [invocation("blob", "".join(chr(rng.randrange(33, 127)) for _ in range(2000)))
+                        for _ in range(count)],
+    }
+
+
+def frame_overhead(size: int) -> int:
+    # Client frames are masked (4 bytes) and use a 2, 4 or 10 bytes header depending on the length
+    return 4 + (2 if size < 126 else 4 if size < 65536 else 10)
+
+
+def measure(messages, enabled: bool, compress_settings: dict, window_bits: int, threshold: int):
+    encoder = ThresholdPerMessageDeflate(False, False, 15, window_bits, compress_settings, threshold=threshold)
+    decoder = PerMessageDeflate(False, False, window_bits, 15)
+    wire, encode_time, decode_time = 0, 0.0, 0.0
+    for data in messages:
+        frame = Frame(Opcode.TEXT, data)
+        if enabled:
+            start = time.perf_counter()
+            frame = encoder.encode(frame)
+            encode_time += time.perf_counter() - start
+            start = time.perf_counter()
+            decoder.decode(frame)
+            decode_time += time.perf_counter() - start
+        wire += len(frame.data) + frame_overhead(len(frame.data))
+    return wire / len(messages), encode_time / len(messages) * 1e6, decode_time / len(messages) * 1e6
+
+
+def main(count: int = 2000):
+    for shape, messages in payloads(count).items():
+        raw = sum(len(x) for x in messages) / len(messages)
+        print(f"\n{shape}: {raw:,.0f} bytes per message")
+        print(f"  {'setting':<26}{'wire bytes':>12}{'ratio':>8}{'encode us':>12}{'decode us':>12}")
+        for name, enabled, compress_settings, window_bits, threshold in SETTINGS:
+            wire, encode, decode = measure(messages, enabled, compress_settings, window_bits, threshold)
+            print(f"  {name:<26}{wire:>12,.0f}{wire / raw:>8.2f}{encode:>12.1f}{decode:>12.1f}")
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
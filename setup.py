@@ -15,7 +15,9 @@ setuptools.setup(
         "async_signalr_client.models",
         "async_signalr_client.models.futures",
         "async_signalr_client.models.messages",
-        "async_signalr_client.protocols"
+        "async_signalr_client.protocols",
+        "async_signalr_client.transports",
+        "async_signalr_client.codecs"
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -23,9 +25,12 @@ setuptools.setup(
         "Topic :: Internet"
     ],
     install_requires=[
-        "websockets>=7.0.0",
+        "websockets>=10.0",
         "aiohttp==3.8.1"
     ],
+    extras_require={
+        "uvloop": ["uvloop>=0.16"]
+    },
     tests_requires=[
         "requests==2.22.0",
         "pytest==7.1.2",
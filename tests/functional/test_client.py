@@ -26,6 +26,7 @@ class TestAsyncSignalRClient:
     @pytest.mark.asyncio
     @pytest.mark.parametrize("transport", [
         transports.WebSocketTransport,
+        transports.ServerSentEventsTransport,
         transports.LongPollingTransport
     ])
     async def test_json_transport_protocol_negotiation(self, signal_r_client, transport):
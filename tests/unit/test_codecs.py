@@ -0,0 +1,126 @@
+import enum
+import typing
+import asyncio
+import pytest
+import datetime
+import dataclasses
+from unittest.mock import AsyncMock
+from async_signalr_client import Connection, SignalRConnectionState
+from async_signalr_client.codecs import TypedArgumentCodec, camel_case
+from async_signalr_client.protocols import JsonProtocol
+from async_signalr_client.exceptions import SignalRInvalidMessageError
+
+
+class Side(enum.Enum):
+    BUY = "buy"
+    SELL = "sell"
+
+
+@dataclasses.dataclass
+class Level:
+    price: float
+    size: int
+
+
+@dataclasses.dataclass
+class Book:
+    symbol: str
+    side: Side
+    levels: typing.List[Level]
+    updated_at: typing.Optional[datetime.datetime] = None
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+class Quote(typing.NamedTuple):
+    symbol: str
+    last_price: float
+    blob: bytes = b""
+
+
+class Slotted:
+    __slots__ = ("name", "values")
+    name: str
+    values: typing.Dict[str, Level]
+
+
+def test_decode_dataclass():
+    codec = TypedArgumentCodec(Book, int)
+    book, count = codec.decode([{"symbol": "ABC", "side": "buy", "levels": [{"price": 1, "size": 2}],
+                                 "updated_at": "2020-01-01T00:00:00Z"}, 5])
+    assert book == Book("ABC", Side.BUY, [Level(1.0, 2)], datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc))
+    assert type(book.levels[0].price) is float
+    assert count == 5
+
+
+def test_decode_named_tuple_camel_case():
+    codec = TypedArgumentCodec(Quote, field_name=camel_case)
+    quote, = codec.decode([{"symbol": "ABC", "lastPrice": 2.5, "blob": "AAE="}])
+    assert quote == Quote("ABC", 2.5, b"\x00\x01")
+    # Binary protocols transfer bytes without base64
+    assert codec.decode([{"symbol": "ABC", "lastPrice": 2.5, "blob": b"\x02"}])[0].blob == b"\x02"
+
+
+def test_decode_slotted_class():
+    codec = TypedArgumentCodec(Slotted)
+    obj, = codec.decode([{"name": "x", "values": {"a": {"price": 1.5, "size": 1}}}])
+    assert obj.name == "x"
+    assert obj.values == {"a": Level(1.5, 1)}
+
+
+def test_decode_invalid():
+    codec = TypedArgumentCodec(Level)
+    with pytest.raises(SignalRInvalidMessageError):
+        codec.decode([{"price": 1}])
+
+
+def test_encode_round_trip():
+    codec = TypedArgumentCodec(Book, Quote, field_name=camel_case)
+    book = Book("ABC", Side.SELL, [Level(1.5, 2)], datetime.datetime(2020, 1, 1), ["x"])
+    quote = Quote("ABC", 2.5, b"\x00")
+    encoded = codec.encode([book, quote])
+    assert encoded[0]["side"] == "sell"
+    assert encoded[0]["updatedAt"] == "2020-01-01T00:00:00"
+    assert encoded[1] == {"symbol": "ABC", "lastPrice": 2.5, "blob": b"\x00"}
+    # Encoded arguments go through the JSON protocol and back
+    protocol = JsonProtocol()
+    raw = protocol.encode({"type": 1, "target": "t", "arguments": encoded})
+    assert codec.decode(protocol.parse(raw).arguments) == [book, quote]
+
+
+async def test_connection_handlers_receive_typed_arguments():
+    conn = Connection("ws://foo.bar")
+    conn._state = SignalRConnectionState.ONLINE
+    conn.register_schema("level", Level)
+    received = []
+
+    async def handler(level):
+        received.append(level)
+
+    conn.on("level", handler)
+    await conn._execute('{"type": 1, "target": "level", "arguments": [{"price": 1, "size": 2}]}')
+    await conn._execute('{"type": 1, "target": "level", "arguments": [{"price": 3, "size": 4}]}')
+    await asyncio.sleep(0)
+    assert received == [Level(1.0, 2), Level(3.0, 4)]
+
+
+async def test_connection_invoke_encodes_arguments():
+    conn = Connection("ws://foo.bar")
+    conn.transport.send = AsyncMock()
+    conn.register_schema("SendLevel", Level)
+    await conn.invoke("SendLevel", Level(1.5, 2))
+    packet = conn.transport.send.call_args[0][0]
+    assert '"arguments": [{"price": 1.5, "size": 2}]' in packet
+
+
+@dataclasses.dataclass
+class Node:
+    name: str
+    children: typing.List["Node"] = dataclasses.field(default_factory=list)
+
+
+def test_decode_self_referencing_record():
+    codec = TypedArgumentCodec(Node)
+    node, = codec.decode([{"name": "a", "children": [{"name": "b", "children": [{"name": "c"}]}]}])
+    assert node == Node("a", [Node("b", [Node("c")])])
+    assert codec.encode([node]) == [{"name": "a", "children": [{"name": "b", "children": [
+        {"name": "c", "children": []}]}]}]
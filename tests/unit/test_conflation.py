@@ -0,0 +1,74 @@
+import asyncio
+from async_signalr_client import Connection
+from async_signalr_client.models import messages
+
+
+def tick(symbol, price):
+    return messages.InvocationMessage(invocation_id=None, target="tick", arguments=[symbol, price])
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+async def test_conflation_latest_value_wins():
+    connection = Connection("ws://foo.bar")
+    received = []
+    release = asyncio.Event()
+
+    async def on_tick(symbol, price):
+        received.append(price)
+        await release.wait()
+
+    connection.on("tick", on_tick)
+    conflator = connection.register_conflation("tick")
+    await connection._call_handlers(tick("ABC", 0))
+    await settle()
+    for price in range(1, 100):
+        await connection._call_handlers(tick("ABC", price))
+    await settle()
+    release.set()
+    await settle()
+    assert received == [0, 99]
+    assert (conflator.merged, conflator.delivered, conflator.pending) == (98, 2, 0)
+
+
+async def test_conflation_keyed_by_argument():
+    connection = Connection("ws://foo.bar")
+    received = []
+
+    async def on_tick(symbol, price):
+        received.append((symbol, price))
+        await asyncio.sleep(0)
+
+    connection.on("tick", on_tick)
+    conflator = connection.register_conflation("tick", key=0)
+    for price in range(3):
+        for symbol in ("ABC", "XYZ"):
+            await connection._call_handlers(tick(symbol, price))
+    await settle()
+    assert sorted(received) == [("ABC", 2), ("XYZ", 2)]
+    assert conflator.merged == 4
+
+
+async def test_conflation_without_key_skips_decoding():
+    connection = Connection("ws://foo.bar")
+    decoded = []
+    received = []
+
+    async def on_tick(price):
+        received.append(price)
+
+    def decoder(raw, offset):
+        decoded.append(raw)
+        return [raw]
+
+    connection.on("tick", on_tick)
+    connection.register_conflation("tick")
+    for price in range(3):
+        await connection._call_handlers(messages.LazyInvocationMessage(None, "tick", price, 0, decoder))
+    await settle()
+    assert received == decoded == [2]
+    connection.unregister_conflation("tick")
+    assert "tick" not in connection._conflators
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from async_signalr_client import Connection
+from async_signalr_client.fanout import FanoutConnection
+from async_signalr_client.exceptions import SignalRConnectionError
+from async_signalr_client.transports import SharedMemoryRing, SharedMemoryTransport
+from async_signalr_client.transports.shared_memory import RingReader, TEXT, BYTES
+
+SEPARATOR = chr(0x1E)
+
+
+@pytest.fixture
+def ring():
+    instance = SharedMemoryRing.create(capacity=256, max_readers=2)
+    yield instance
+    instance.close()
+
+
+def test_ring_publish_read(ring):
+    reader = RingReader(SharedMemoryRing.attach(ring.name))
+    ring.publish(b"foo")
+    ring.publish(b"\x00\x01", BYTES)
+    assert reader.read() == [(TEXT, b"foo"), (BYTES, b"\x00\x01")]
+    assert reader.read() == []
+    assert ring.readers()[0][1] == 0
+    reader.close()
+    reader.ring.close()
+
+
+def test_ring_wraps_records(ring):
+    reader = RingReader(ring)
+    payloads = [bytes([i]) * 50 for i in range(20)]
+    received = []
+    for payload in payloads:
+        ring.publish(payload)
+        received.extend(x[1] for x in reader.read())
+    assert received == payloads
+    assert reader.overruns == 0
+
+
+def test_ring_detects_slow_reader(ring):
+    reader = RingReader(ring)
+    for i in range(10):
+        ring.publish(bytes([i]) * 50)
+    assert ring.slow_readers(0.5)
+    assert reader.read() == []
+    assert reader.overruns == 1 and reader.dropped_bytes > ring.capacity
+    ring.publish(b"bar")
+    assert reader.read() == [(TEXT, b"bar")]
+    assert not ring.slow_readers(0.5)
+
+
+def test_ring_reader_slots_exhausted(ring):
+    RingReader(ring), RingReader(ring)
+    with pytest.raises(SignalRConnectionError):
+        RingReader(ring)
+
+
+def test_ring_record_too_large(ring):
+    with pytest.raises(ValueError):
+        ring.publish(bytes(ring.capacity))
+
+
+async def test_fanout_subscriber_receives_events():
+    publisher = FanoutConnection("ws://foo.bar", ring_capacity=2**16)
+    subscriber = Connection(f"shm://{publisher.ring_name}", transport=SharedMemoryTransport)
+    received = asyncio.Queue()
+
+    async def on_foo(*args):
+        received.put_nowait(args)
+
+    subscriber.on("foo", on_foo)
+    subscriber_task = asyncio.ensure_future(subscriber.start())
+    # Publisher receives the handshake and an event from its own socket
+    publisher._state = publisher.state.CONNECTING
+    process_task = asyncio.ensure_future(publisher.process())
+    publisher.event_queue.put_nowait("{}" + SEPARATOR)
+    publisher.event_queue.put_nowait('{"type": 1, "target": "foo", "arguments": ["bar", 1]}' + SEPARATOR)
+    await asyncio.wait_for(subscriber_task, 1)
+    assert await asyncio.wait_for(received.get(), 1) == ("bar", 1)
+    with pytest.raises(SignalRConnectionError):
+        await subscriber.invoke("foo")
+    await subscriber.stop()
+    await subscriber.transport.stop()
+    subscriber.keep_alive_task.cancel()
+    process_task.cancel()
+    await publisher.stop()
@@ -0,0 +1,42 @@
+import logging
+from async_signalr_client import Connection, log
+
+
+class ExplodingPayload:
+    def __str__(self):
+        raise AssertionError("Payload should not be formatted")
+
+
+def test_handler_attached_once():
+    logger = logging.getLogger(log.LOGGER_NAME)
+    Connection("ws://foo.bar")
+    handlers = len(logger.handlers)
+    for _ in range(5):
+        Connection("ws://foo.bar")
+    assert len(logger.handlers) == handlers
+
+
+def test_wire_logger_disabled_does_not_format(caplog):
+    logger = logging.getLogger("test-wire-disabled")
+    logger.setLevel(logging.INFO)
+    wire = log.WireLogger(logger)
+    with caplog.at_level(logging.INFO, logger="test-wire-disabled"):
+        wire.log("Received", ExplodingPayload())
+    assert caplog.records == []
+
+
+def test_wire_logger_sampling(caplog):
+    wire = log.WireLogger(logging.getLogger("test-wire-sampled"), sample_every=10)
+    with caplog.at_level(logging.DEBUG, logger="test-wire-sampled"):
+        for i in range(100):
+            wire.log("Received", i)
+    assert len(caplog.records) == 10
+
+
+def test_wire_logger_truncation(caplog):
+    wire = log.WireLogger(logging.getLogger("test-wire-truncated"), max_length=8)
+    with caplog.at_level(logging.DEBUG, logger="test-wire-truncated"):
+        wire.log("Sent", "a" * 100)
+        wire.log("Sent", b"b" * 100)
+    assert caplog.records[0].getMessage() == "Sent: aaaaaaaa...[truncated]"
+    assert caplog.records[1].getMessage() == "Sent: bbbbbbbb...[truncated]"
@@ -1,9 +1,11 @@
 import pytest
 from async_signalr_client.protocols import JsonProtocol
+from async_signalr_client.exceptions import SignalRInvalidMessageError
 from async_signalr_client.models.messages import (
     SignalRMessageType,
     BaseMessage,
     InvocationMessage,
+    LazyInvocationMessage,
     CompletionMessage,
     PingMessage
 )
@@ -62,3 +64,34 @@ def test_invocation_encoder():
     setattr(obj, 'invocation_id', 100)
     protocol = JsonProtocol()
     assert protocol.encode(obj) == '{"invocationId": 100}' + protocol.separator
+
+
+@pytest.mark.parametrize("raw, target, arguments", [
+    ('{"type": 1, "target": "tick", "arguments": [1, {"a": [2, 3]}, "x"]}', "tick", [1, {"a": [2, 3]}, "x"]),
+    ('{"type":1,"invocationId":"1","target":"tick","arguments":[]}', "tick", []),
+    ('{"type": 1, "arguments": ["first"], "target": "tick"}', "tick", ["first"]),
+    ('{"type": 1, "headers": {"arguments": 1}, "target": "tick", "arguments": [2]}', "tick", [2])
+])
+def test_parse_lazy_arguments(raw, target, arguments):
+    protocol = JsonProtocol(lazy_arguments=True)
+    message = protocol.parse(raw)
+    assert isinstance(message, InvocationMessage)
+    assert message.target == target
+    assert message.arguments == arguments
+
+
+def test_parse_lazy_arguments_deferred():
+    protocol = JsonProtocol(lazy_arguments=True)
+    message = protocol.parse('{"type": 1, "invocationId": "7", "target": "tick", "arguments": [1, 2')
+    assert isinstance(message, LazyInvocationMessage)
+    assert message.invocation_id == "7"
+    assert message.decoded is False
+    # Invalid arguments are only detected once accessed
+    with pytest.raises(SignalRInvalidMessageError):
+        message.arguments
+
+
+def test_parse_lazy_arguments_other_types():
+    protocol = JsonProtocol(lazy_arguments=True)
+    assert type(protocol.parse('{"type": 6}')) is PingMessage
+    assert type(protocol.parse('{"type": 3, "invocationId": "1", "result": 1}')) is CompletionMessage
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from async_signalr_client import Connection
+from async_signalr_client.recording import WireRecorder, RecordingQueue, read_recording, replay
+
+SEPARATOR = chr(0x1E)
+HANDSHAKE = "{}" + SEPARATOR
+INVOCATION = '{"type": 1, "target": "foo", "arguments": ["bar", 1]}' + SEPARATOR
+
+
+@pytest.fixture
+def recording_path(tmp_path):
+    return str(tmp_path / "traffic.rec")
+
+
+def test_recorder_round_trip(recording_path):
+    with WireRecorder(recording_path) as recorder:
+        recorder.record(HANDSHAKE)
+        recorder.record(b"\x01\x02")
+    with WireRecorder(recording_path) as recorder:
+        recorder.record(INVOCATION)
+    frames = list(read_recording(recording_path))
+    assert [x[1] for x in frames] == [HANDSHAKE, b"\x01\x02", INVOCATION]
+    assert all(offset >= 0 for offset, _ in frames)
+
+
+def test_read_recording_truncated(recording_path):
+    with WireRecorder(recording_path) as recorder:
+        recorder.record(HANDSHAKE)
+        recorder.record(INVOCATION)
+    with open(recording_path, "rb+") as f:
+        f.truncate(f.seek(0, 2) - 1)
+    assert [x[1] for x in read_recording(recording_path)] == [HANDSHAKE]
+
+
+def test_read_recording_invalid(recording_path):
+    with open(recording_path, "wb") as f:
+        f.write(b"foo")
+    with pytest.raises(ValueError):
+        list(read_recording(recording_path))
+
+
+async def test_connection_records_event_queue(recording_path):
+    with WireRecorder(recording_path) as recorder:
+        connection = Connection("ws://foo.bar", recorder=recorder)
+        assert isinstance(connection.event_queue, RecordingQueue)
+        await connection.event_queue.put(HANDSHAKE)
+        connection.event_queue.put_nowait(INVOCATION)
+    assert [x[1] for x in read_recording(recording_path)] == [HANDSHAKE, INVOCATION]
+
+
+@pytest.mark.parametrize("speed", [None, 100])
+async def test_replay_dispatches_handlers(recording_path, speed):
+    with WireRecorder(recording_path) as recorder:
+        recorder.record(HANDSHAKE)
+        recorder.record(INVOCATION + INVOCATION)
+        recorder.record(INVOCATION)
+    received = []
+
+    async def on_foo(*args):
+        await asyncio.sleep(0)
+        received.append(args)
+
+    connection = Connection("ws://foo.bar")
+    connection.on("foo", on_foo)
+    assert await replay(connection, recording_path, speed=speed) == 3
+    assert received == [("bar", 1)] * 3
+    assert connection.connection_established.done()
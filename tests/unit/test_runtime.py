@@ -0,0 +1,28 @@
+import pytest
+import asyncio
+from async_signalr_client import Connection, runtime
+
+
+async def use_connection(conn: Connection):
+    conn.event_queue.put_nowait("payload")
+    conn.connection_established.set_result(True)
+    async with conn.establishing_connection_lock:
+        return await conn.event_queue.get(), await conn.connection_established
+
+
+@pytest.mark.parametrize("use_uvloop", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not runtime.uvloop_available(), reason="uvloop not installed"))
+])
+def test_connection_created_outside_loop(use_uvloop):
+    conn = Connection("ws://foo.bar")
+    assert runtime.run(use_connection(conn), use_uvloop=use_uvloop) == ("payload", True)
+
+
+def test_uvloop_missing(monkeypatch):
+    monkeypatch.setattr(runtime, "uvloop", None)
+    with pytest.raises(ImportError):
+        runtime.new_event_loop(use_uvloop=True)
+    loop = runtime.new_event_loop()
+    assert isinstance(loop, asyncio.AbstractEventLoop)
+    loop.close()
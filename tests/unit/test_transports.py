@@ -1,10 +1,26 @@
+import time
 import pytest
 import asyncio
+import functools
 import websockets
 from unittest.mock import AsyncMock, MagicMock
+from websockets.frames import Frame, Opcode
+from websockets.extensions.permessage_deflate import PerMessageDeflate
 from async_signalr_client.protocols import BaseSignalRProtocol
 from async_signalr_client.exceptions import SignalRConnectionError
-from async_signalr_client.transports import LongPollingTransport, WebSocketTransport
+from async_signalr_client.transports import (
+    auto_transport,
+    BaseTransport,
+    LongPollingTransport,
+    WebSocketTransport,
+    ServerSentEventsTransport,
+    AutoTransport,
+    NegotiationCache,
+    CachingResolver,
+    NetworkContext
+)
+from async_signalr_client.transports.server_sent_events_transport import ServerSentEventsParser
+from async_signalr_client.transports.compression import ThresholdPerMessageDeflate
 
 
 @pytest.mark.parametrize("transport, actual_url, expected_url", [
@@ -12,6 +28,8 @@ from async_signalr_client.transports import LongPollingTransport, WebSocketTrans
     (LongPollingTransport, "https://foo.bar", "https://foo.bar"),
     (LongPollingTransport, "ws://foo.bar", "http://foo.bar"),
     (LongPollingTransport, "wss://foo.bar", "https://foo.bar"),
+    (ServerSentEventsTransport, "ws://foo.bar", "http://foo.bar"),
+    (ServerSentEventsTransport, "wss://foo.bar", "https://foo.bar"),
     (WebSocketTransport, "http://foo.bar", "ws://foo.bar"),
     (WebSocketTransport, "https://foo.bar", "wss://foo.bar"),
     (WebSocketTransport, "ws://foo.bar", "ws://foo.bar"),
@@ -44,7 +62,8 @@ async def test_connect(transport):
 
 @pytest.mark.parametrize("transport", [
     LongPollingTransport,
-    WebSocketTransport
+    WebSocketTransport,
+    ServerSentEventsTransport
 ])
 async def test_connect_invalid_transport(transport):
     instance = transport('http://foo.bar:5000')
@@ -88,7 +107,8 @@ async def test_send_websockets():
 
 @pytest.mark.parametrize("transport", [
     LongPollingTransport,
-    WebSocketTransport
+    WebSocketTransport,
+    ServerSentEventsTransport
 ])
 @pytest.mark.parametrize("property_missing", [
     "conn",
@@ -110,7 +130,8 @@ async def test_send_not_connected(transport, property_missing):
 
 @pytest.mark.parametrize("transport", [
     LongPollingTransport,
-    WebSocketTransport
+    WebSocketTransport,
+    ServerSentEventsTransport
 ])
 async def test_send_connection_stopped(transport):
     instance = transport('http://foo.bar:5000')
@@ -124,3 +145,175 @@ async def test_send_connection_stopped(transport):
     # Expect connection error to be raised
     with pytest.raises(SignalRConnectionError):
         await instance.send(packet)
+
+
+async def test_websockets_connect_options(monkeypatch):
+    connect = AsyncMock()
+    monkeypatch.setattr(websockets, "connect", connect)
+    instance = WebSocketTransport('http://foo.bar:5000', compression_threshold=256, memory_level=8, max_size=None,
+                                  read_limit=1024, write_limit=2048)
+    instance.send = AsyncMock()
+    instance.validate_transport = AsyncMock(return_value=True)
+    instance.receive = AsyncMock()
+    await instance.connect(AsyncMock(BaseSignalRProtocol), AsyncMock(asyncio.Queue))
+    kwargs = connect.call_args.kwargs
+    assert kwargs["max_size"] is None
+    assert kwargs["read_limit"] == 1024
+    assert kwargs["write_limit"] == 2048
+    factory, = kwargs["extensions"]
+    assert factory.threshold == 256
+    assert factory.compress_settings == {"memLevel": 8}
+
+
+def test_websockets_compression_disabled():
+    instance = WebSocketTransport('http://foo.bar:5000', compression=False)
+    assert instance.connect_options["compression"] is None
+    assert "extensions" not in instance.connect_options
+
+
+@pytest.mark.parametrize("size, compressed", [
+    (10, False),
+    (1000, True)
+])
+def test_threshold_per_message_deflate(size, compressed):
+    encoder = ThresholdPerMessageDeflate(False, False, 15, 15, threshold=100)
+    decoder = PerMessageDeflate(False, False, 15, 15)
+    frame = Frame(Opcode.TEXT, b"a" * size)
+    encoded = encoder.encode(frame)
+    assert encoded.rsv1 is compressed
+    assert decoder.decode(encoded).data == frame.data
+
+
+async def test_connect_server_sent_events():
+    instance = ServerSentEventsTransport('http://foo.bar:5000')
+    instance.conn = AsyncMock()
+    instance.send = AsyncMock()
+    instance.validate_transport = AsyncMock(return_value=True)
+    instance._open_stream = AsyncMock()
+    instance.receive = AsyncMock()
+    queue = AsyncMock(asyncio.Queue)
+    await instance.connect(AsyncMock(BaseSignalRProtocol), queue)
+    instance._open_stream.assert_called_once()
+    instance.send.assert_called_once()
+    instance.receive.assert_called_once_with(queue)
+
+
+async def test_send_server_sent_events():
+    instance = ServerSentEventsTransport('http://foo.bar:5000')
+    instance.connection_id = 'abc'
+    instance.conn = MagicMock()
+    instance.conn.post.return_value.__aenter__.return_value.status = 200
+    instance.receive_task = AsyncMock()
+    await instance.send(100)
+    instance.conn.post.assert_called_once_with('http://foo.bar:5000', data=100, params={"id": "abc"})
+
+
+@pytest.mark.parametrize("chunks, expected", [
+    ([b"data: a\n\n"], ["a"]),
+    ([b"da", b"ta: a\r", b"\n\r\ndata: b\n", b"\n"], ["a", "b"]),
+    ([b"data: line1\ndata: line2\n\n"], ["line1\nline2"]),
+    ([b": keep-alive comment\n\ndata:x\n\n"], ["x"]),
+    ([b"event: message\nid: 1\ndata: a\n", b"\n", b"data: incomplete\n"], ["a"]),
+    (["data: \u00e9\n\n".encode()[:7], "data: \u00e9\n\n".encode()[7:]], ["\u00e9"])
+])
+def test_server_sent_events_parser(chunks, expected):
+    parser = ServerSentEventsParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    assert events == expected
+
+
+class FakeTransport(BaseTransport):
+    fail = set()
+    attempts = []
+
+    def __init__(self, url, name):
+        super().__init__(url, name)
+
+    async def connect(self, protocol, queue, on_online=None, on_offline=None):
+        FakeTransport.attempts.append((self.transport_name, self.negotiation is not None))
+        if self.transport_name in self.fail:
+            raise OSError("Upgrade blocked")
+
+    async def stop(self):
+        pass
+
+
+@pytest.fixture
+def fake_transports(monkeypatch):
+    FakeTransport.attempts = []
+    FakeTransport.fail = set()
+    monkeypatch.setattr(auto_transport, "get_transport", lambda name: functools.partial(FakeTransport, name=name))
+    return FakeTransport
+
+
+async def test_auto_transport_fallback(fake_transports):
+    fake_transports.fail = {"WebSockets"}
+    cache = NegotiationCache()
+    instance = AutoTransport('wss://foo.bar:5000/chat', cache=cache)
+    instance.negotiate = AsyncMock(return_value={"connectionId": "abc", "availableTransports": [
+        {"transport": "LongPolling"}, {"transport": "ServerSentEvents"}, {"transport": "WebSockets"}]})
+    await instance.connect(AsyncMock(BaseSignalRProtocol), AsyncMock(asyncio.Queue))
+    assert instance.transport.transport_name == "ServerSentEvents"
+    # Available transports are negotiated once, the first attempt reuses the response
+    instance.negotiate.assert_called_once()
+    assert fake_transports.attempts == [("WebSockets", True), ("ServerSentEvents", False)]
+    assert cache.get("foo.bar:5000") == "ServerSentEvents"
+
+    # Following connections to the same host go straight to the cached transport
+    fake_transports.attempts = []
+    instance = AutoTransport('wss://foo.bar:5000/chat', cache=cache)
+    instance.negotiate = AsyncMock()
+    await instance.connect(AsyncMock(BaseSignalRProtocol), AsyncMock(asyncio.Queue))
+    instance.negotiate.assert_not_called()
+    assert fake_transports.attempts == [("ServerSentEvents", False)]
+
+
+async def test_auto_transport_unavailable(fake_transports):
+    fake_transports.fail = {"WebSockets", "LongPolling"}
+    instance = AutoTransport('http://foo.bar:5000', cache=NegotiationCache())
+    instance.negotiate = AsyncMock(return_value={"availableTransports": [
+        {"transport": "LongPolling"}, {"transport": "WebSockets"}]})
+    with pytest.raises(SignalRConnectionError):
+        await instance.connect(AsyncMock(BaseSignalRProtocol), AsyncMock(asyncio.Queue))
+    assert [x[0] for x in fake_transports.attempts] == ["WebSockets", "LongPolling"]
+
+
+def test_negotiation_cache_ttl(monkeypatch):
+    cache = NegotiationCache(ttl_s=10)
+    cache.set("foo.bar", "WebSockets")
+    assert cache.get("foo.bar") == "WebSockets"
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert cache.get("foo.bar") is None
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("ws://foo.bar/chat", "http://foo.bar/chat/negotiate"),
+    ("wss://foo.bar/chat", "https://foo.bar/chat/negotiate"),
+    ("https://foo.bar/chat", "https://foo.bar/chat/negotiate")
+])
+def test_assemble_negotiate_url(url, expected):
+    assert BaseTransport._assemble_negotiate_url(url) == expected
+
+
+async def test_caching_resolver_coalesces_lookups(monkeypatch):
+    resolver = CachingResolver(ttl_s=10)
+    getaddrinfo = AsyncMock(return_value=[(2, 1, 6, '', ('10.0.0.1', 443))])
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    results = await asyncio.gather(*(resolver.resolve("foo.bar", 443) for _ in range(10)))
+    assert all(x[0]["host"] == "10.0.0.1" for x in results)
+    await resolver.resolve("foo.bar", 443)
+    assert resolver.lookups == 1
+    getaddrinfo.assert_awaited_once()
+
+
+async def test_shared_session_not_closed_by_transport():
+    network = NetworkContext()
+    instance = ServerSentEventsTransport('http://foo.bar:5000', network=network)
+    instance.conn = instance._client_session()
+    assert instance.conn is network.session
+    await instance._close_client_session()
+    assert not network.session.closed
+    await network.close()